@@ -0,0 +1,69 @@
+import importlib.util
+import tempfile
+import unittest
+import cadquery as cq
+import numpy as np
+from turbodesigner.cad.cache import get_cad_cache_key, read_cached_assembly, write_cached_assembly
+from tests.designs import mark1
+
+
+class CadCacheTest(unittest.TestCase):
+    def test_cached_assembly_round_trip(self):
+        blade = cq.Assembly(cq.Workplane("XY").box(1, 2, 10), name="Blade", color=cq.Color("red"))
+        blades = cq.Assembly(name="Blades")
+        for i in range(3):
+            blades.add(blade, loc=cq.Location(cq.Vector(5, 0, 0), cq.Vector(0, 0, 1), 120*i), name=f"Blade {i+1}")
+        assembly = cq.Assembly(cq.Solid.makeCylinder(20, 5), name="Stage")
+        assembly.add(blades, loc=cq.Location(cq.Vector(0, 0, 5)), name="Blades")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            key = get_cad_cache_key("stage", 1)
+            self.assertIsNone(read_cached_assembly(cache_dir, key))
+            write_cached_assembly(cache_dir, key, assembly)
+            cached_assembly = read_cached_assembly(cache_dir, key)
+
+        assert cached_assembly is not None
+        self.assertEqual(cached_assembly.name, "Stage")
+        self.assertEqual([child.name for child in cached_assembly.children], ["Blades"])
+        self.assertEqual(
+            [(child.name, child.loc.toTuple()) for child in cached_assembly.children[0].children],
+            [(child.name, child.loc.toTuple()) for child in blades.children]
+        )
+        self.assertEqual(cached_assembly.children[0].children[0].color.toTuple(), cq.Color("red").toTuple())  # type: ignore
+        self.assertAlmostEqual(cached_assembly.toCompound().Volume(), assembly.toCompound().Volume())
+
+    def test_cad_cache_key(self):
+        stages = mark1.to_cad_export().stages
+        key = get_cad_cache_key("casing", stages[1], stages[0], stages[0], None)
+
+        # lazily evaluated design properties and a repeated export must not change the key
+        mark1.stages[1].rotor.deHaller
+        mark1.stages[1].stator.airfoils
+        exported_stages = mark1.to_cad_export().stages
+        self.assertEqual(key, get_cad_cache_key("casing", exported_stages[1], exported_stages[0], exported_stages[0], None))
+        self.assertNotEqual(key, get_cad_cache_key("casing", stages[0], stages[0], None, None))
+
+    @unittest.skipUnless(importlib.util.find_spec("cq_warehouse"), "casing cad models require cq_warehouse")
+    def test_casing_assembly_cache_hit(self):
+        from turbodesigner.cad.casing import CasingCadModel, CasingCadModelSpecifciation
+
+        def assert_same_tree(built: cq.Assembly, cached: cq.Assembly):
+            self.assertEqual(built.name, cached.name)
+            self.assertEqual(len(built.children), len(cached.children))
+            (built_translation, built_rotation), (cached_translation, cached_rotation) = built.loc.toTuple(), cached.loc.toTuple()
+            np.testing.assert_allclose(built_translation + built_rotation, cached_translation + cached_rotation, atol=1e-9)
+            for built_child, cached_child in zip(built.children, cached.children):
+                assert_same_tree(built_child, cached_child)
+
+        turbomachinery = mark1.to_cad_export()
+        spec = CasingCadModelSpecifciation(is_simple=True)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            built_assembly = CasingCadModel.casing_assembly(turbomachinery, spec, cache_dir=cache_dir)
+            cached_assembly = CasingCadModel.casing_assembly(turbomachinery, spec, cache_dir=cache_dir)
+
+        assert_same_tree(built_assembly, cached_assembly)
+        self.assertAlmostEqual(built_assembly.toCompound().Volume(), cached_assembly.toCompound().Volume(), places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,16 @@
+import numpy as np
+
+
+def assert_all_almost_equal(checks: list[tuple[str, float, float, int]]):
+    """batched np.testing.assert_almost_equal in a single array comparison
+
+    checks: list[tuple[str, float, float, int]]
+        (name, actual, desired, decimal) for each value
+
+    """
+    names, actual, desired, decimal = zip(*checks)
+    np.testing.assert_array_less(
+        np.abs(np.array(desired, dtype=np.float64) - np.array(actual, dtype=np.float64)),
+        1.5 * 10.0**(-np.array(decimal, dtype=np.float64)),
+        err_msg=", ".join(names)
+    )
@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+from turbodesigner.airfoils import DCAAirfoil, DCAAirfoilBatch
+from tests.designs import mark1
+
+
+class DCAAirfoilTest(unittest.TestCase):
+    def test_batch_matches_single_airfoils(self):
+        c = 0.05                                    # m
+        theta = np.radians([25.0, -15.0, 0.0, 40.0])  # rad
+        xi = np.radians([5.0, 30.0, -10.0, 20.0])     # rad
+        tb = 0.004                                  # m
+        r0 = tb * 0.15                              # m
+
+        batch = DCAAirfoilBatch(c, theta, r0, tb, xi)
+        airfoils = [DCAAirfoil(c, theta[i], r0, tb, xi[i]) for i in range(len(theta))]
+
+        np.testing.assert_allclose(batch.get_coords(), np.array([airfoil.get_coords() for airfoil in airfoils]), atol=1e-12)
+        np.testing.assert_allclose(batch.get_camber_line(), np.array([airfoil.get_camber_line() for airfoil in airfoils]), atol=1e-12)
+
+    def test_batch_unequal_arc_points(self):
+        theta = np.radians([20.0, 20.0])     # rad
+        r0 = np.array([0.0001, 0.01])        # m
+        with self.assertRaises(ValueError):
+            DCAAirfoilBatch(0.05, theta, r0, 0.004).get_coords()
+
+    def test_row_airfoils_indexing(self):
+        rotor = mark1.stages[1].rotor
+        airfoil = rotor.airfoils[0]
+
+        self.assertIsInstance(airfoil, DCAAirfoil)
+        self.assertEqual(len(list(rotor.airfoils)), rotor.N_stream)
+        np.testing.assert_allclose(airfoil.get_coords(), rotor.airfoils.get_coords()[0], atol=1e-12)
+        np.testing.assert_allclose(rotor.airfoils[-1].get_coords(), rotor.airfoils.get_coords()[-1], atol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
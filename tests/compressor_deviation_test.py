@@ -1,3 +1,4 @@
+import math
 import unittest
 from turbodesigner.blade.deviation.johnsen_bullock import JohnsenBullockBladeDeviation, AirfoilType
 import numpy as np
@@ -7,8 +8,8 @@ class AungierDeviationTest(unittest.TestCase):
 
     def test_aungier_deviation(self):
         deviation = JohnsenBullockBladeDeviation(
-            beta1=np.radians(70),               # rad
-            beta2=np.radians(20),               # rad
+            beta1=math.radians(70),               # rad
+            beta2=math.radians(20),               # rad
             sigma=2.0,                          # dimensionless
             tbc=0.1,                            # dimensionless
             airfoil_type=AirfoilType.NACA65
@@ -17,36 +18,60 @@ class AungierDeviationTest(unittest.TestCase):
         metal_angles = deviation.get_metal_angles(100)
 
 
-        np.testing.assert_almost_equal(np.degrees(metal_angles.kappa1), 73.9657, 4)
-        np.testing.assert_almost_equal(np.degrees(metal_angles.kappa2), -0.4597, 4)
+        np.testing.assert_almost_equal(math.degrees(metal_angles.kappa1), 73.9657, 4)
+        np.testing.assert_almost_equal(math.degrees(metal_angles.kappa2), -0.4597, 4)
 
 
 
     def test_aungier_zero_camber_sigma_2(self):
         deviation = JohnsenBullockBladeDeviation(
-            beta1=np.radians(70),               # rad
-            beta2=np.radians(70),               # rad
+            beta1=math.radians(70),               # rad
+            beta2=math.radians(70),               # rad
             sigma=2.0,                          # dimensionless
             tbc=0.1,                            # dimensionless
             airfoil_type=AirfoilType.NACA65
         )
 
         metal_angles = deviation.get_metal_angles(1)
-        np.testing.assert_almost_equal(np.degrees(metal_angles.i), 10.1975, 4)
-        np.testing.assert_almost_equal(np.degrees(metal_angles.delta), 4.7296, 4)
+        np.testing.assert_almost_equal(math.degrees(metal_angles.i), 10.1975, 4)
+        np.testing.assert_almost_equal(math.degrees(metal_angles.delta), 4.7296, 4)
 
     def test_aungier_zero_camber_sigma_1(self):
         deviation = JohnsenBullockBladeDeviation(
-            beta1=np.radians(70),               # rad
-            beta2=np.radians(70),               # rad
+            beta1=math.radians(70),               # rad
+            beta2=math.radians(70),               # rad
             sigma=1.0,                          # dimensionless
             tbc=0.1,                            # dimensionless
             airfoil_type=AirfoilType.NACA65
         )
 
         metal_angles = deviation.get_metal_angles(1)
-        np.testing.assert_almost_equal(np.degrees(metal_angles.i), 5.0897, 4)
-        np.testing.assert_almost_equal(np.degrees(metal_angles.delta), 2.5691, 4)
+        np.testing.assert_almost_equal(math.degrees(metal_angles.i), 5.0897, 4)
+        np.testing.assert_almost_equal(math.degrees(metal_angles.delta), 2.5691, 4)
+
+    def test_deviation_batch(self):
+        deviations = [
+            JohnsenBullockBladeDeviation(
+                beta1=math.radians(70),                         # rad
+                beta2=math.radians(20),                         # rad
+                sigma=2.0,                                      # dimensionless
+                tbc=0.1,                                        # dimensionless
+                airfoil_type=AirfoilType.NACA65
+            ),
+            JohnsenBullockBladeDeviation(
+                beta1=np.radians([-50.0, -60.0, -67.0]),        # rad
+                beta2=np.radians([-30.0, -52.0, -62.0]),        # rad
+                sigma=1.2,                                      # dimensionless
+                tbc=0.1,                                        # dimensionless
+                airfoil_type=AirfoilType.DCA
+            ),
+        ]
+
+        batch = JohnsenBullockBladeDeviation.get_metal_angles_batch(deviations, 20)
+        for deviation, metal_angles in zip(deviations, batch):
+            expected = deviation.get_metal_angles(20)
+            np.testing.assert_allclose(metal_angles.kappa1, expected.kappa1)
+            np.testing.assert_allclose(metal_angles.kappa2, expected.kappa2)
 
 
 
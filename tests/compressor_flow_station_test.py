@@ -1,7 +1,9 @@
+import math
 import unittest
 import numpy as np
 from turbodesigner.flow_station import FlowStation
 from turbodesigner.stage import Stage
+from tests.common import assert_all_almost_equal
 
 
 class CompressorFlowStationTest(unittest.TestCase):
@@ -18,13 +20,15 @@ class CompressorFlowStationTest(unittest.TestCase):
             radius=0.08,        # m
         )
 
-        np.testing.assert_almost_equal(inlet_flow_station.beta, np.radians(-48.808), 3)
-        np.testing.assert_almost_equal(inlet_flow_station.U, 301.593, 3)
-        np.testing.assert_almost_equal(inlet_flow_station.V, 263.95, 3)
-        np.testing.assert_almost_equal(inlet_flow_station.Vcr, 388.169, 3)
-        np.testing.assert_almost_equal(inlet_flow_station.Ttr, 495.275, 3)
-        np.testing.assert_almost_equal(inlet_flow_station.Ptr, 391631.736, 3)
-        np.testing.assert_almost_equal(inlet_flow_station.Vtheta, 0.00, 3)
+        assert_all_almost_equal([
+            ("beta", inlet_flow_station.beta, math.radians(-48.808), 3),
+            ("U", inlet_flow_station.U, 301.593, 3),
+            ("V", inlet_flow_station.V, 263.95, 3),
+            ("Vcr", inlet_flow_station.Vcr, 388.169, 3),
+            ("Ttr", inlet_flow_station.Ttr, 495.275, 3),
+            ("Ptr", inlet_flow_station.Ptr, 391631.736, 3),
+            ("Vtheta", inlet_flow_station.Vtheta, 0.00, 3),
+        ])
 
         mid_flow_station = FlowStation(
             gamma=1.4,          # dimensionless
@@ -38,9 +42,11 @@ class CompressorFlowStationTest(unittest.TestCase):
             radius=0.08,        # m
         )
 
-        np.testing.assert_almost_equal(mid_flow_station.Wtheta, -123.715, 3)
-        np.testing.assert_almost_equal(mid_flow_station.Ttr, 496.469, 3)
-        np.testing.assert_almost_equal(mid_flow_station.Ptr,340102.039, 3)
+        assert_all_almost_equal([
+            ("Wtheta", mid_flow_station.Wtheta, -123.715, 3),
+            ("Ttr", mid_flow_station.Ttr, 496.469, 3),
+            ("Ptr", mid_flow_station.Ptr, 340102.039, 3),
+        ])
 
 
     def test_velocity_triangle(self):
@@ -55,27 +61,50 @@ class CompressorFlowStationTest(unittest.TestCase):
             Vm=150,                         # m/s
             N=15000,                        # RPM
             radius=0.1696031,               # m
-            alpha=np.radians(26.69005971),  # rad
+            alpha=math.radians(26.69005971),  # rad
         )
 
-        # Inlet Flow Station
-        np.testing.assert_almost_equal(np.degrees(inlet_flow_station.alpha), 0.0)
-        np.testing.assert_almost_equal(np.degrees(inlet_flow_station.beta), -60.61884197)
-        np.testing.assert_almost_equal(inlet_flow_station.Vm, 150.0)
-        np.testing.assert_almost_equal(inlet_flow_station.Vtheta, 0.0)
-        np.testing.assert_almost_equal(inlet_flow_station.V, 150.0)
-        np.testing.assert_almost_equal(inlet_flow_station.U, 266.41192649)
-        np.testing.assert_almost_equal(inlet_flow_station.Wtheta, -266.41192649)
-        np.testing.assert_almost_equal(inlet_flow_station.W, 305.73732938)
-
-        # Outlet Flow Station
-        np.testing.assert_almost_equal(np.degrees(outlet_flow_station.alpha), 26.69005971)
-        np.testing.assert_almost_equal(np.degrees(outlet_flow_station.beta), -51.85637225)
-        np.testing.assert_almost_equal(outlet_flow_station.Vm, 150.0)
-        np.testing.assert_almost_equal(outlet_flow_station.Vtheta, 75.40953689)
-        np.testing.assert_almost_equal(outlet_flow_station.V, 167.88864838)
-        np.testing.assert_almost_equal(outlet_flow_station.Wtheta, -191.0023896)
-        np.testing.assert_almost_equal(outlet_flow_station.W, 242.86192133)
+        assert_all_almost_equal([
+            # Inlet Flow Station
+            ("inlet alpha", math.degrees(inlet_flow_station.alpha), 0.0, 7),
+            ("inlet beta", math.degrees(inlet_flow_station.beta), -60.61884197, 7),
+            ("inlet Vm", inlet_flow_station.Vm, 150.0, 7),
+            ("inlet Vtheta", inlet_flow_station.Vtheta, 0.0, 7),
+            ("inlet V", inlet_flow_station.V, 150.0, 7),
+            ("inlet U", inlet_flow_station.U, 266.41192649, 7),
+            ("inlet Wtheta", inlet_flow_station.Wtheta, -266.41192649, 7),
+            ("inlet W", inlet_flow_station.W, 305.73732938, 7),
+
+            # Outlet Flow Station
+            ("outlet alpha", math.degrees(outlet_flow_station.alpha), 26.69005971, 7),
+            ("outlet beta", math.degrees(outlet_flow_station.beta), -51.85637225, 7),
+            ("outlet Vm", outlet_flow_station.Vm, 150.0, 7),
+            ("outlet Vtheta", outlet_flow_station.Vtheta, 75.40953689, 7),
+            ("outlet V", outlet_flow_station.V, 167.88864838, 7),
+            ("outlet Wtheta", outlet_flow_station.Wtheta, -191.0023896, 7),
+            ("outlet W", outlet_flow_station.W, 242.86192133, 7),
+        ])
+
+    def test_input_assignment(self):
+        flow_station = FlowStation(gamma=1.4, Rs=287, Tt=450, Pt=2.80E5, mdot=2.2, Vm=150, alpha=0.3, N=36000, radius=0.08)
+        flow_station.Vm = 200
+        flow_station.radius = 0.1
+        expected_flow_station = FlowStation(gamma=1.4, Rs=287, Tt=450, Pt=2.80E5, mdot=2.2, Vm=200, alpha=0.3, N=36000, radius=0.1)
+
+        assert_all_almost_equal([
+            ("V", flow_station.V, expected_flow_station.V, 7),
+            ("T", flow_station.T, expected_flow_station.T, 7),
+            ("U", flow_station.U, expected_flow_station.U, 7),
+            ("W", flow_station.W, expected_flow_station.W, 7),
+        ])
+
+    def test_partially_undefined_alpha(self):
+        flow_station = FlowStation(gamma=1.4, Rs=287, Tt=450, Pt=2.80E5, Vm=150, alpha=np.array([0.3, np.nan]), N=36000, radius=np.array([0.08, 0.1]))
+        self.assertAlmostEqual(flow_station.V[0], 150/math.cos(0.3))
+        self.assertTrue(np.isnan(flow_station.V[1]))
+
+        undefined_flow_station = FlowStation(gamma=1.4, Rs=287, Tt=450, Pt=2.80E5, Vm=150, N=36000, radius=0.08)
+        self.assertAlmostEqual(undefined_flow_station.V, 150)
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import math
 import unittest
 import numpy as np
 from turbodesigner.flow_station import FlowStation
@@ -35,14 +36,18 @@ class VelocityTriangleTest(unittest.TestCase):
         # Hub
         np.testing.assert_almost_equal(ctheta1_hub, 87.31, 2)
         np.testing.assert_almost_equal(ctheta2_hub, 261.755, 3)
-        np.testing.assert_almost_equal(np.degrees(alpha1_hub), 32.70, 2)
-        np.testing.assert_almost_equal(np.degrees(alpha2_hub), 62.54, 2)
+        np.testing.assert_almost_equal(math.degrees(alpha1_hub), 32.70, 2)
+        np.testing.assert_almost_equal(math.degrees(alpha2_hub), 62.54, 2)
 
         # Tip
         np.testing.assert_almost_equal(ctheta1_tip, 78.57, 2)
         np.testing.assert_almost_equal(ctheta2_tip, 235.58, 2)
-        np.testing.assert_almost_equal(np.degrees(alpha1_tip), 30.02, 2)
-        np.testing.assert_almost_equal(np.degrees(alpha2_tip), 60.00, 2)
+        np.testing.assert_almost_equal(math.degrees(alpha1_tip), 30.02, 2)
+        np.testing.assert_almost_equal(math.degrees(alpha2_tip), 60.00, 2)
+
+        # Rotating and stationary rows stacked
+        alpha_pair = vortex.alpha_pair(np.array([0.45, 0.5]))
+        np.testing.assert_almost_equal(alpha_pair, [[alpha1_hub, alpha1_tip], [alpha2_hub, alpha2_tip]], 12)
 
 
 if __name__ == '__main__':
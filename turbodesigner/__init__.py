@@ -0,0 +1,4 @@
+import os
+
+# keep compiled numba kernels in one project-level directory so test and CI runs can reuse them
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(os.path.dirname(__file__), ".numba_cache"))
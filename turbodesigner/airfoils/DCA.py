@@ -1,10 +1,27 @@
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Optional, Union
-import plotly.graph_objects as go
+import math
 import numpy as np
+from numba import njit
 from turbodesigner.airfoils.common import get_staggered_coords
 
+def get_circle_height(x: Union[float, np.ndarray], R: Union[float, np.ndarray]):
+    """height of circle above its center, sqrt(R**2 - x**2), in a single buffer (length)
+
+        x: float | np.ndarray
+            horizontal distance from circle center (length)
+
+        R: float | np.ndarray
+            circle radius (length)
+    """
+    if isinstance(x, np.ndarray):
+        height = np.multiply(x, x, dtype=np.float64)
+        np.subtract(R*R, height, out=height)
+        return np.sqrt(height, out=height)
+    return math.sqrt(R*R - x*x)
+
+
 @dataclass
 class DCAAirfoil:
     c: float
@@ -28,7 +45,43 @@ class DCAAirfoil:
     def __post_init__(self):
         if self.theta == 0:
             self.theta = 1E-5
-        self.theta_mag = np.abs(self.theta)
+        self.theta_mag = abs(self.theta)
+        self.theta_sign = 1.0 if self.theta > 0 else -1.0
+
+        # camber angle terms shared by camber line, circles and arcs
+        self.sin_half_theta_mag = math.sin(self.theta_mag/2)
+        self.cos_half_theta_mag = math.cos(self.theta_mag/2)
+        self.tan_quarter_theta_mag = math.tan(self.theta_mag/4)
+
+        # radius of curvature (length)
+        self.Rc = (self.c/2) / math.sin(self.theta/2)
+
+        # camber line y-coordinate origin of radius (length)
+        self.yc0 = -self.Rc * math.cos(self.theta/2)
+
+        # read-only coordinates keyed by (num_arc_points, num_circle_points)
+        self._coords_cache: dict[tuple[int, int], np.ndarray] = {}
+
+        # arc x sample positions keyed by number of points, shared by upper and lower arcs
+        self._arc_x_cache: dict[int, np.ndarray] = {}
+
+    @staticmethod
+    def batch(
+        c: Union[float, np.ndarray],
+        theta: np.ndarray,
+        r0: Union[float, np.ndarray],
+        tb: Union[float, np.ndarray],
+        xi: Union[float, np.ndarray] = 0,
+    ) -> "DCAAirfoilBatch":
+        """airfoils for each camber and stagger angle evaluated together (DCAAirfoilBatch)
+
+            theta: np.ndarray
+                camber angle for each airfoil (rad)
+
+            xi: float | np.ndarray
+                stagger angle for each airfoil (rad)
+        """
+        return DCAAirfoilBatch(c, theta, r0, tb, xi)
 
 
     def get_camber_line(self, xc:Optional[Union[float, np.ndarray]] = None, is_staggered: bool = True, is_centered: bool = True,  num_points = 20):
@@ -40,20 +93,24 @@ class DCAAirfoil:
         # horizontal position of camber or chord line (length)
         if xc is None:
             xc = np.linspace(-self.c/2, self.c/2, num_points, endpoint=True)
-        y_sign = np.sign(self.theta)
-        # radius of curvature (length)
-        Rc = (self.c/2) * (1/(np.sin(self.theta/2)))
-        
-        # camber line y-coordinate origin of radius (length)
-        yc0 = -Rc * np.cos(self.theta/2)
-        
+        y_sign = self.theta_sign
+        Rc = self.Rc
+        yc0 = self.yc0
+
         # vertical position of camber of chord line (length)
-        yc = yc0 + np.sqrt(Rc**2 - xc**2) * y_sign
+        yc = get_circle_height(xc, Rc)
+        yc *= y_sign
+        yc += yc0
 
-        camber_line = np.array([xc,yc]).T
+        if isinstance(xc, np.ndarray):
+            camber_line = np.empty((xc.shape[0], 2))
+            camber_line[:, 0] = xc
+            camber_line[:, 1] = yc
+        else:
+            camber_line = np.array([xc, yc])
 
         if is_centered:
-            camber_line = camber_line - np.array([0,yc0 + np.sqrt(Rc**2) * y_sign])
+            camber_line = camber_line - np.array([0,yc0 + abs(Rc) * y_sign])
 
         if is_staggered:
             camber_line = get_staggered_coords(camber_line, self.xi)
@@ -70,17 +127,23 @@ class DCAAirfoil:
         """
 
         x_sign = -1 if is_left else 1
-        x_center = x_sign*(self.c/2 - self.r0*np.cos(self.theta_mag/2))
-        y_center = self.r0 * np.sin(self.theta_mag/2)
+        x_center = x_sign*(self.c/2 - self.r0*self.cos_half_theta_mag)
+        y_center = self.r0 * self.sin_half_theta_mag
 
         center_to_end_distance = (x_sign*self.c/2) - x_center
         angle_offset = np.pi - np.arccos(center_to_end_distance/self.r0) + np.pi/2
         angle = np.linspace(0, np.pi, num_points, endpoint=True) + angle_offset
 
-        x = self.r0 * np.cos(angle) + x_center
-        y = (self.r0 * np.sin(angle) + y_center) * np.sign(self.theta)
-
-        return np.array([x,y]).T
+        circle = np.empty((num_points, 2))
+        x, y = circle[:, 0], circle[:, 1]
+        np.cos(angle, out=x)
+        x *= self.r0
+        x += x_center
+        np.sin(angle, out=y)
+        y *= self.r0
+        y += y_center
+        y *= self.theta_sign
+        return circle
 
 
     def get_arc(self, is_lower = False, num_points=20):
@@ -95,24 +158,34 @@ class DCAAirfoil:
         r0 = input_sign*self.r0
         tb = input_sign*self.tb
 
-        x = np.linspace(-self.c*self.arc_weight/2, self.c*self.arc_weight/2, num=num_points)
+        x = self._arc_x_cache.get(num_points)
+        if x is None:
+            x = np.linspace(-self.c*self.arc_weight/2, self.c*self.arc_weight/2, num=num_points)
+            x.setflags(write=False)
+            self._arc_x_cache[num_points] = x
 
         # camberline coordinate at mid coord (length)
-        ym = (self.c/2)*np.tan(self.theta_mag/4)
+        ym = (self.c/2)*self.tan_quarter_theta_mag
         
         # radius of circular arc (length)
-        d = ym + (tb / 2) - r0*np.sin(self.theta_mag/2)
-        R = (d**2 - (r0**2) + ((self.c/2) - r0 * np.cos(self.theta_mag/2))**2)/(2*(d-r0))
+        d = ym + (tb / 2) - r0*self.sin_half_theta_mag
+        R = (d**2 - (r0**2) + ((self.c/2) - r0 * self.cos_half_theta_mag)**2)/(2*(d-r0))
         
         # origin of circular arc (length)
         y0 = ym + (tb/2) - R
 
-        y = np.sign(self.theta) * (y0 + np.sqrt(R**2 - x**2))
+        y = get_circle_height(x, R)
+        y += y0
+        y *= self.theta_sign
 
-        if is_lower and np.abs(y[0]) > self.tb*2:
-            y = -np.sign(self.theta) * np.ones(num_points) * self.r0
+        # lower arc collapses to a flat line at the nose radius when it overshoots
+        if is_lower and abs(y[0]) > self.tb*2:
+            y.fill(-self.theta_sign * self.r0)
 
-        return np.array([x,y]).T
+        arc = np.empty((num_points, 2))
+        arc[:, 0] = x
+        arc[:, 1] = y
+        return arc
     
     def get_coords(
         self, 
@@ -129,6 +202,9 @@ class DCAAirfoil:
 
         """
         # Info: x coordinates are [:,0] and y coordinates are [:,1]
+        key = (num_arc_points, num_circle_points)
+        if key in self._coords_cache:
+            return self._coords_cache[key]
 
         # Circles
         left_circle = self.get_circle(is_left=True, num_points=num_circle_points)
@@ -137,31 +213,48 @@ class DCAAirfoil:
         # Arcs
         upper_arc = self.get_arc(is_lower=False, num_points=num_arc_points)
         lower_arc = self.get_arc(is_lower=True, num_points=num_arc_points)
-        left_circle_start = np.array([left_circle[0]])
 
-        upper_cond = np.where(np.logical_and(upper_arc[:,0] > left_circle[0,0], upper_arc[:,0] < right_circle[-1,0]))
-        lower_cond = np.where(np.logical_and(lower_arc[:,0] > left_circle[-1,0], lower_arc[:,0] < right_circle[0,0]))
-        
+        # arc x coordinates are ascending, so points strictly between the circles form one contiguous slice
+        upper_lo = np.searchsorted(upper_arc[:,0], left_circle[0,0], side="right")
+        upper_hi = np.searchsorted(upper_arc[:,0], right_circle[-1,0], side="left")
+        lower_lo = np.searchsorted(lower_arc[:,0], left_circle[-1,0], side="right")
+        lower_hi = np.searchsorted(lower_arc[:,0], right_circle[0,0], side="left")
+        lower_segment = lower_arc[lower_lo:lower_hi]
+        upper_segment = upper_arc[upper_lo:upper_hi][::-1]
+
+        # left circle, lower arc, right circle, upper arc reversed and closing point blitted into one polygon
+        n_lower = lower_segment.shape[0]
+        n_upper = upper_segment.shape[0]
+        airfoil = np.empty((2*num_circle_points + n_lower + n_upper + 1, 2))
+        lower_start = num_circle_points
+        right_start = lower_start + n_lower
+        upper_start = right_start + num_circle_points
+        airfoil[:lower_start] = left_circle
+        airfoil[lower_start:right_start] = lower_segment
+        airfoil[right_start:upper_start] = right_circle
+        airfoil[upper_start:-1] = upper_segment
+        airfoil[-1] = left_circle[0]
+
         center = self.get_camber_line(0, is_staggered=False, is_centered=False)
-        airfoil = np.concatenate(
-            [
-                left_circle, 
-                lower_arc[lower_cond],
-                right_circle, 
-                np.flip(upper_arc[upper_cond], axis=0), 
-                left_circle_start
-            ]
-        ) - center
-
-        return get_staggered_coords(airfoil, self.xi)
+        airfoil -= center
+
+        coords = get_staggered_coords(airfoil, self.xi, out=airfoil)
+        coords.setflags(write=False)
+        self._coords_cache[key] = coords
+        return coords
 
     def visualize(
         self,
-        fig=go.Figure(),
+        fig=None,
         show=True,
         num_arc_points: int = 20, 
         num_circle_points: int = 10
     ):
+        # plotly is only needed for visualization, keep it off the import path
+        import plotly.graph_objects as go
+        if fig is None:
+            fig = go.Figure()
+
         camber_xy = self.get_camber_line(num_points=num_arc_points)
         fig.add_trace(go.Scatter(
             x=camber_xy[:, 0],
@@ -178,3 +271,268 @@ class DCAAirfoil:
         fig.layout.yaxis.scaleanchor="x"  # type: ignore
         if show:
             fig.show()
+
+
+@njit(cache=True)
+def _dca_circle_point(c: float, r0: float, sin_half_theta_mag: float, cos_half_theta_mag: float, theta_sign: float, is_left: bool, k: int, num_points: int):
+    "k-th nose circle point of one DCA airfoil, matching DCAAirfoil.get_circle (x, y)"
+    x_sign = -1.0 if is_left else 1.0
+    x_center = x_sign*(c/2 - r0*cos_half_theta_mag)
+    y_center = r0*sin_half_theta_mag
+    angle_offset = math.pi - math.acos(((x_sign*c/2) - x_center)/r0) + math.pi/2
+    angle = (math.pi if k == num_points - 1 else k*(math.pi/(num_points - 1))) + angle_offset
+    return r0*math.cos(angle) + x_center, (r0*math.sin(angle) + y_center)*theta_sign
+
+
+@njit(cache=True)
+def _dca_arc_x(c: float, arc_weight: float, k: int, num_points: int):
+    "k-th arc x sample of one DCA airfoil, matching DCAAirfoil.get_arc (length)"
+    x_unit = 0.5 if k == num_points - 1 else -0.5 + k*(1.0/(num_points - 1))
+    return x_unit*(c*arc_weight)
+
+
+@njit(cache=True)
+def _dca_arc_circle(c: float, r0: float, tb: float, sin_half_theta_mag: float, cos_half_theta_mag: float, tan_quarter_theta_mag: float, is_lower: bool):
+    "radius and origin height of suction or pressure side arc of one DCA airfoil (R, y0)"
+    input_sign = -1.0 if is_lower else 1.0
+    r0 = input_sign*r0
+    tb = input_sign*tb
+    ym = (c/2)*tan_quarter_theta_mag
+    d = ym + (tb/2) - r0*sin_half_theta_mag
+    R = (d**2 - (r0**2) + ((c/2) - r0*cos_half_theta_mag)**2)/(2*(d - r0))
+    return R, ym + (tb/2) - R
+
+
+@njit(cache=True)
+def dca_arc_point_counts(c, theta, r0, arc_weight, num_arc_points, num_circle_points):
+    """number of arc points strictly between the nose circles of each airfoil (n_lower, n_upper)
+
+    Parameters
+    ==========
+
+    c, theta, r0: np.ndarray
+        chord length (length), camber angle (rad) and nose radius (length) of each airfoil
+
+    arc_weight: float
+        percentage of how much of x coordinates to load for arc
+
+    num_arc_points, num_circle_points: int
+        number of arc and circle points
+
+    """
+    N = theta.shape[0]
+    n_lower = np.zeros(N, dtype=np.int64)
+    n_upper = np.zeros(N, dtype=np.int64)
+    for i in range(N):
+        theta_mag = abs(theta[i])
+        theta_sign = 1.0 if theta[i] > 0 else -1.0
+        sin_h, cos_h = math.sin(theta_mag/2), math.cos(theta_mag/2)
+        left_first_x = _dca_circle_point(c[i], r0[i], sin_h, cos_h, theta_sign, True, 0, num_circle_points)[0]
+        left_last_x = _dca_circle_point(c[i], r0[i], sin_h, cos_h, theta_sign, True, num_circle_points - 1, num_circle_points)[0]
+        right_first_x = _dca_circle_point(c[i], r0[i], sin_h, cos_h, theta_sign, False, 0, num_circle_points)[0]
+        right_last_x = _dca_circle_point(c[i], r0[i], sin_h, cos_h, theta_sign, False, num_circle_points - 1, num_circle_points)[0]
+        for k in range(num_arc_points):
+            x = _dca_arc_x(c[i], arc_weight, k, num_arc_points)
+            if x > left_first_x and x < right_last_x:
+                n_upper[i] += 1
+            if x > left_last_x and x < right_first_x:
+                n_lower[i] += 1
+    return n_lower, n_upper
+
+
+@njit(cache=True)
+def dca_coords_batch(c, theta, r0, tb, xi, arc_weight, num_arc_points, num_circle_points, n_lower, n_upper):
+    """double circular arc airfoil coordinates of airfoils sharing arc point counts (N, num_points, 2)
+
+    Parameters
+    ==========
+
+    c, theta, r0, tb, xi: np.ndarray
+        chord length (length), camber angle (rad), nose radius (length), max thickness (length) and stagger angle (rad) of each airfoil
+
+    arc_weight: float
+        percentage of how much of x coordinates to load for arc
+
+    num_arc_points, num_circle_points: int
+        number of arc and circle points
+
+    n_lower, n_upper: int
+        number of lower and upper arc points of every airfoil
+
+    """
+    N = theta.shape[0]
+    lower_start = num_circle_points
+    right_start = lower_start + n_lower
+    upper_start = right_start + num_circle_points
+    num_points = upper_start + n_upper + 1
+    coords = np.empty((N, num_points, 2))
+
+    for i in range(N):
+        theta_mag = abs(theta[i])
+        theta_sign = 1.0 if theta[i] > 0 else -1.0
+        sin_h, cos_h = math.sin(theta_mag/2), math.cos(theta_mag/2)
+        tan_q = math.tan(theta_mag/4)
+        airfoil = coords[i]
+
+        # left circle, lower arc, right circle, upper arc reversed and closing point
+        for k in range(num_circle_points):
+            airfoil[k, 0], airfoil[k, 1] = _dca_circle_point(c[i], r0[i], sin_h, cos_h, theta_sign, True, k, num_circle_points)
+            airfoil[right_start + k, 0], airfoil[right_start + k, 1] = _dca_circle_point(c[i], r0[i], sin_h, cos_h, theta_sign, False, k, num_circle_points)
+        airfoil[num_points - 1, 0], airfoil[num_points - 1, 1] = airfoil[0, 0], airfoil[0, 1]
+
+        R_lower, y0_lower = _dca_arc_circle(c[i], r0[i], tb[i], sin_h, cos_h, tan_q, True)
+        R_upper, y0_upper = _dca_arc_circle(c[i], r0[i], tb[i], sin_h, cos_h, tan_q, False)
+        x_first = _dca_arc_x(c[i], arc_weight, 0, num_arc_points)
+        # lower arc collapses to a flat line at the nose radius when it overshoots
+        is_flat = abs(theta_sign*(y0_lower + math.sqrt(R_lower*R_lower - x_first*x_first))) > tb[i]*2
+        lower_k = lower_start
+        upper_k = num_points - 2
+        left_first_x, left_last_x = airfoil[0, 0], airfoil[num_circle_points - 1, 0]
+        right_first_x, right_last_x = airfoil[right_start, 0], airfoil[upper_start - 1, 0]
+        for k in range(num_arc_points):
+            x = _dca_arc_x(c[i], arc_weight, k, num_arc_points)
+            if x > left_last_x and x < right_first_x:
+                airfoil[lower_k, 0] = x
+                if is_flat:
+                    airfoil[lower_k, 1] = -theta_sign*r0[i]
+                else:
+                    airfoil[lower_k, 1] = theta_sign*(y0_lower + math.sqrt(R_lower*R_lower - x*x))
+                lower_k += 1
+            if x > left_first_x and x < right_last_x:
+                airfoil[upper_k, 0] = x
+                airfoil[upper_k, 1] = theta_sign*(y0_upper + math.sqrt(R_upper*R_upper - x*x))
+                upper_k -= 1
+
+        # camber line center at mid chord, then rotate by stagger angle
+        Rc = (c[i]/2)/math.sin(theta[i]/2)
+        yc0 = -Rc*math.cos(theta[i]/2)
+        y_center = yc0 + abs(Rc)*theta_sign
+        cos_xi, sin_xi = math.cos(xi[i]), math.sin(xi[i])
+        for k in range(num_points):
+            x = airfoil[k, 0]
+            y = airfoil[k, 1] - y_center
+            airfoil[k, 0] = x*cos_xi - y*sin_xi
+            airfoil[k, 1] = x*sin_xi + y*cos_xi
+    return coords
+
+
+@dataclass
+class DCAAirfoilBatch:
+    "double circular arc airfoils evaluated together, one row per airfoil"
+
+    c: Union[float, np.ndarray]
+    "chord length (length)"
+
+    theta: np.ndarray
+    "camber angle (rad)"
+
+    r0: Union[float, np.ndarray]
+    "double circular arc airfoil nose radius (length)"
+
+    tb: Union[float, np.ndarray]
+    "max thickness (length)"
+
+    xi: Union[float, np.ndarray] = 0
+    "stagger angle (rad)"
+
+    arc_weight: float = 0.8
+    "percentage of how much of x coordinates to load for arc"
+
+    def __post_init__(self):
+        # airfoil parameters as (N, 1) columns broadcasting against (N, num_points) samples
+        theta = np.atleast_1d(np.asarray(self.theta, dtype=np.float64))
+        self.theta = np.where(theta == 0, 1E-5, theta)
+        shape = (self.theta.shape[0], 1)
+        self.theta_col = self.theta.reshape(shape)
+        self.c_col = np.broadcast_to(np.asarray(self.c, dtype=np.float64).reshape(-1, 1), shape)
+        self.r0_col = np.broadcast_to(np.asarray(self.r0, dtype=np.float64).reshape(-1, 1), shape)
+        self.tb_col = np.broadcast_to(np.asarray(self.tb, dtype=np.float64).reshape(-1, 1), shape)
+        self.xi_col = np.broadcast_to(np.asarray(self.xi, dtype=np.float64).reshape(-1, 1), shape)
+
+        self.theta_sign = np.where(self.theta_col > 0, 1.0, -1.0)
+
+        # radius of curvature (length)
+        self.Rc = (self.c_col/2) / np.sin(self.theta_col/2)
+
+        # camber line y-coordinate origin of radius (length)
+        self.yc0 = -self.Rc * np.cos(self.theta_col/2)
+
+        # read-only coordinates keyed by (num_arc_points, num_circle_points)
+        self._coords_cache: dict[tuple[int, int], np.ndarray] = {}
+
+    def __len__(self):
+        return self.theta.shape[0]
+
+    def __getitem__(self, i: int):
+        "airfoil at index i, same as constructing it on its own (DCAAirfoil)"
+        return DCAAirfoil(
+            float(self.c_col[i, 0]),
+            float(self.theta[i]),
+            float(self.r0_col[i, 0]),
+            float(self.tb_col[i, 0]),
+            float(self.xi_col[i, 0]),
+            self.arc_weight
+        )
+
+    def get_staggered_coords(self, coords: np.ndarray):
+        "rotates (N, num_points, 2) coordinates by each airfoil stagger angle (length)"
+        cos_xi, sin_xi = np.cos(self.xi_col), np.sin(self.xi_col)
+        x, y = coords[..., 0], coords[..., 1]
+        staggered = np.empty_like(coords)
+        staggered[..., 0] = x*cos_xi - y*sin_xi
+        staggered[..., 1] = x*sin_xi + y*cos_xi
+        return staggered
+
+    def get_camber_line(self, is_staggered: bool = True, is_centered: bool = True, num_points: int = 20):
+        """coordinates of camber lines (N, num_points, 2) (length)
+
+            num_points: int
+                number of points
+        """
+        xc = np.linspace(-0.5, 0.5, num_points, endpoint=True)*self.c_col
+        yc = self.yc0 + get_circle_height(xc, self.Rc)*self.theta_sign
+
+        camber_line = np.empty((len(self), num_points, 2))
+        camber_line[..., 0] = xc
+        camber_line[..., 1] = yc
+        if is_centered:
+            camber_line[..., 1] -= self.yc0 + np.abs(self.Rc)*self.theta_sign
+
+        if is_staggered:
+            camber_line = self.get_staggered_coords(camber_line)
+        return camber_line
+
+    def get_coords(
+        self,
+        num_arc_points: int = 20,
+        num_circle_points: int = 10
+    ):
+        """double circular arc airfoil coordinates (N, num_points, 2)
+
+            num_arc_points: int
+                number of arc points
+
+            num_circle_points: int
+                number of circle points
+
+        """
+        key = (num_arc_points, num_circle_points)
+        if key in self._coords_cache:
+            return self._coords_cache[key]
+
+        c, theta, r0, tb, xi = (np.array(column[:, 0], dtype=np.float64) for column in (self.c_col, self.theta_col, self.r0_col, self.tb_col, self.xi_col))
+        n_lower, n_upper = dca_arc_point_counts(c, theta, r0, float(self.arc_weight), int(num_arc_points), int(num_circle_points))
+        if np.any(n_lower != n_lower[0]) or np.any(n_upper != n_upper[0]):
+            raise ValueError("airfoils must have equal number of arc points")
+
+        coords = dca_coords_batch(
+            c, theta, r0, tb, xi,
+            float(self.arc_weight),
+            int(num_arc_points),
+            int(num_circle_points),
+            int(n_lower[0]),
+            int(n_upper[0]),
+        )
+        coords.setflags(write=False)
+        self._coords_cache[key] = coords
+        return coords
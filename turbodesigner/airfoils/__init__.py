@@ -1,2 +1,2 @@
 from turbodesigner.airfoils.common import AirfoilType
-from turbodesigner.airfoils.DCA import DCAAirfoil
\ No newline at end of file
+from turbodesigner.airfoils.DCA import DCAAirfoil, DCAAirfoilBatch
\ No newline at end of file
@@ -1,4 +1,6 @@
 from enum import Enum
+from typing import Optional
+import math
 import numpy as np
 
 class AirfoilType(Enum):
@@ -6,11 +8,14 @@ class AirfoilType(Enum):
     DCA = 2
     C4 = 2
 
-def get_staggered_coords(coords: np.ndarray, stagger_angle: float):
-    x = coords[:, 0]
-    y = coords[:, 1]
+def get_staggered_coords(coords: np.ndarray, stagger_angle: float, out: Optional[np.ndarray] = None):
+    cos_xi = math.cos(stagger_angle)
+    sin_xi = math.sin(stagger_angle)
 
-    return np.array([
-        x*np.cos(stagger_angle) - y*np.sin(stagger_angle),
-        x*np.sin(stagger_angle) + y*np.cos(stagger_angle),
-    ]).T 
+    # row vectors rotated counter-clockwise by the stagger angle
+    # small memory-bound product, out may alias coords to rotate in place (matmul buffers overlap)
+    rotation = np.array([
+        [cos_xi, sin_xi],
+        [-sin_xi, cos_xi],
+    ])
+    return np.matmul(coords, rotation, out=out)
@@ -1,45 +1,111 @@
 from functools import cached_property
-from typing import Optional
+from typing import Optional, Union
+import math
 import numpy as np
 from dataclasses import dataclass
-import plotly.graph_objects as go
+from numba import njit
+
+Point = Union[tuple[float, float], np.ndarray]
+"2D point as an (x, y) pair"
 
 def get_line(
     y: np.ndarray,
-    point1: np.ndarray,
-    point2: np.ndarray,
+    point1: Point,
+    point2: Point,
     y_int: Optional[int] = None
 ):
     x2, y2 = point2[0], point2[1]
     x1, y1 = point1[0], point1[1]
-    m = (y2 - y1) / (x2 - x1)
-    b = y2 - m*x2 if y_int is None else 0
-    x = (y-b)/m
-    return np.array([x, y]).T
+    # inverse slope dx/dy, line is parameterized by y
+    inv_m = (x2 - x1) / (y2 - y1)
+    line = np.empty((y.shape[0], 2))
+    x = line[:, 0]
+    if y_int is None:
+        np.subtract(y, y1, out=x)
+        x *= inv_m
+        x += x1
+    else:
+        np.multiply(y, inv_m, out=x)
+    line[:, 1] = y
+    return line
+
+
+@njit("float64[:, :](float64, float64, float64, float64, float64, int64, boolean)", cache=True)
+def fill_arc(cx: float, cy: float, radius: float, angle1: float, angle2: float, num_points: int, endpoint: bool):
+    """arc coordinates sampled evenly from angle1 to angle2 (N, 2)
+
+    Parameters
+    ==========
+
+    cx, cy: float
+        arc center
+
+    radius: float
+        arc radius
+
+    angle1, angle2: float
+        start and end angle (rad)
+
+    num_points: int
+        number of points
+
+    endpoint: bool
+        whether angle2 is included
+
+    """
+    arc = np.empty((num_points, 2))
+    num_steps = num_points - 1 if endpoint else num_points
+    step = (angle2 - angle1)/num_steps if num_steps > 0 else 0.0
+    for i in range(num_points):
+        angle = angle1 + i*step
+        arc[i, 0] = cx + radius*math.cos(angle)
+        arc[i, 1] = cy + radius*math.sin(angle)
+    return arc
 
 
 def get_arc(
-    lower_point: np.ndarray,
-    upper_point: np.ndarray,
+    lower_point: Point,
+    upper_point: Point,
     radius: float,
-    center: np.ndarray,
+    center: Point,
     num_points: int,
     is_clockwise: bool = True,
     endpoint: bool = True
 ):
-    lower_distance = lower_point - center
-    upper_distance = upper_point - center
-    angle1 = np.arctan2(lower_distance[1], lower_distance[0])
-    angle2 = np.arctan2(upper_distance[1], upper_distance[0])
+    cx, cy = float(center[0]), float(center[1])
+    angle1 = math.atan2(lower_point[1] - cy, lower_point[0] - cx)
+    angle2 = math.atan2(upper_point[1] - cy, upper_point[0] - cx)
 
     if not is_clockwise:
-        angle1 = angle1 + 2*np.pi
+        angle1 = angle1 + 2*math.pi
 
-    angle = np.linspace(angle1, angle2, num_points, endpoint=endpoint)
-    return center + np.array([
-        radius * np.cos(angle),
-        radius * np.sin(angle),
-    ]).T
+    return fill_arc(cx, cy, float(radius), angle1, angle2, num_points, endpoint)
+
+
+@njit("float64[:, :](float64[:, :], int64)", cache=True)
+def tile_stages(stage: np.ndarray, num_stages: int):
+    """tiles stage coordinates end to end, each stage starting at the end of the previous one
+
+    Parameters
+    ==========
+
+    stage: np.ndarray
+        single stage coordinates (M, 2)
+
+    num_stages: int
+        number of stages
+
+    """
+    num_points = stage.shape[0]
+    out = np.empty(((num_points - 1)*num_stages + 1, 2))
+    out[:num_points] = stage
+    for i in range(1, num_stages):
+        start = i*(num_points - 1)
+        dx, dy = out[start, 0], out[start, 1]
+        for j in range(num_points):
+            out[start + j, 0] = stage[j, 0] + dx
+            out[start + j, 1] = stage[j, 1] + dy
+    return out
 
 
 @dataclass
@@ -84,36 +150,31 @@ class FirtreeAttachment:
     "number of arc points"
 
     def __post_init__(self):
-        self.origin = np.array([0, 0])
+        # landmark points are stored as (x, y) float pairs so geometry helpers read plain floats
+        self.origin: Point = (0.0, 0.0)
+
+        # flank angle terms shared by every circle and tangent point
+        cos_beta, sin_beta = math.cos(self.beta), math.sin(self.beta)
+        cos_gamma, sin_gamma = math.cos(self.gamma), math.sin(self.gamma)
 
         # Outer Circle
-        self.outer_circle_lower_tangent = self.origin + (
-            np.array([self.ll*np.cos(self.beta), self.ll*np.sin(self.beta)])
-        )
-        self.outer_circle_upper_tangent = self.outer_circle_lower_tangent + (
-            np.array([0, 2*self.Ro*np.cos(self.gamma)])
-        )
-        self.outer_circle_tanget_intersect = self.outer_circle_lower_tangent + (
-            np.array([self.Ro*(1 - np.sin(self.gamma)**2)/np.sin(self.gamma), self.Ro*np.cos(self.gamma),])
-        )
-        self.outer_circle_center = self.outer_circle_lower_tangent + (
-            np.array([-self.Ro*np.sin(self.gamma), self.Ro*np.cos(self.gamma)])
-        )
+        olx, oly = self.origin[0] + self.ll*cos_beta, self.origin[1] + self.ll*sin_beta
+        self.outer_circle_lower_tangent: Point = (olx, oly)
+        self.outer_circle_upper_tangent: Point = (olx, oly + 2*self.Ro*cos_gamma)
+        self.outer_circle_tanget_intersect: Point = (olx + self.Ro*(1 - sin_gamma**2)/sin_gamma, oly + self.Ro*cos_gamma)
+        self.outer_circle_center: Point = (olx - self.Ro*sin_gamma, oly + self.Ro*cos_gamma)
 
         # Inner Circle
-        self.inner_circle_lower_tangent = self.outer_circle_upper_tangent + (
-            np.array([-self.lu*np.cos(self.gamma), self.lu*np.sin(self.gamma)])
-        )
-        self.inner_circle_upper_tangent = self.inner_circle_lower_tangent + (
-            np.array([0, 2*self.Ri*np.cos(self.gamma)])
-        )
-        self.inner_circle_center = self.inner_circle_lower_tangent + (
-            np.array([self.Ri*np.sin(self.beta), self.Ri*np.cos(self.beta)])
-        )
+        oux, ouy = self.outer_circle_upper_tangent
+        ilx, ily = oux - self.lu*cos_gamma, ouy + self.lu*sin_gamma
+        self.inner_circle_lower_tangent: Point = (ilx, ily)
+        self.inner_circle_upper_tangent: Point = (ilx, ily + 2*self.Ri*cos_gamma)
+        self.inner_circle_center: Point = (ilx + self.Ri*sin_beta, ily + self.Ri*cos_beta)
 
         # Dove
-        self.dove_circle_center = np.array([self.R_dove*np.sin(self.beta), -self.R_dove*np.cos(self.beta)])
-        self.dove_lower_point = self.dove_circle_center + np.array([0,-self.R_dove])
+        dcx, dcy = self.R_dove*sin_beta, -self.R_dove*cos_beta
+        self.dove_circle_center: Point = (dcx, dcy)
+        self.dove_lower_point: Point = (dcx, dcy - self.R_dove)
 
     @cached_property
     def dove_arc(self):
@@ -127,20 +188,22 @@ class FirtreeAttachment:
         top_arc_right_point = top_arc_left_point + np.array([max_length, 0])
         
         if self.include_top_arc:
-            sector_angle = 2*np.arcsin((max_length/2)/self.disk_radius)
-            top_arc_height = self.disk_radius - (max_length/2)/np.tan(sector_angle/2)
-            disk_center = np.array([0,top_arc_left_point[1]-self.disk_radius+top_arc_height])
+            sector_angle = 2*math.asin((max_length/2)/self.disk_radius)
+            top_arc_height = self.disk_radius - (max_length/2)/math.tan(sector_angle/2)
+            disk_center = (0.0, top_arc_left_point[1]-self.disk_radius+top_arc_height)
             return get_arc(top_arc_left_point, top_arc_right_point, self.disk_radius, disk_center, self.num_arc_points)
 
         return np.concatenate([[top_arc_left_point], [top_arc_right_point]])
 
     def get_stage(self, end_stage: bool = False):
         "calculates firtree single stage coordinates"
-        # Flank Lines
-        yl = np.linspace(self.origin[1], self.outer_circle_lower_tangent[1], 2, endpoint=False)
+        # Flank Lines, start and mid point of each flank (same as 2 point linspace without endpoint)
+        yl_start, yl_end = self.origin[1], self.outer_circle_lower_tangent[1]
+        yl = np.array([yl_start, yl_start + (yl_end - yl_start)/2])
         lower_flank_line = get_line(yl, self.origin, self.outer_circle_lower_tangent)
 
-        yu = np.linspace(self.outer_circle_upper_tangent[1], self.inner_circle_lower_tangent[1], 2, endpoint=False)
+        yu_start, yu_end = self.outer_circle_upper_tangent[1], self.inner_circle_lower_tangent[1]
+        yu = np.array([yu_start, yu_start + (yu_end - yu_start)/2])
         upper_flank_line = get_line(yu, self.outer_circle_tanget_intersect, self.outer_circle_upper_tangent)
 
         # Arcs
@@ -156,22 +219,11 @@ class FirtreeAttachment:
     @cached_property
     def left_side(self) -> np.ndarray:
         "calculates firtree attachment left side coordinates"
-        stage = self.get_stage()
-        attachment_stage_side:Optional[np.ndarray] = None
         assert self.num_stages > 0, "num stages must greater than 0"
-        # TODO: make this more efficient with Numba
-        for i in range(self.num_stages):
-            next_stage = stage
-            if attachment_stage_side is not None:
-                attachment_stage_side = np.concatenate([
-                    attachment_stage_side[:-1], 
-                    next_stage + attachment_stage_side[-1]
-                ])
-            else:
-                attachment_stage_side = next_stage
-        
+        stage = self.get_stage().astype(np.float64, copy=False)
+        attachment_stage_side = tile_stages(stage, self.num_stages)
+
         # offset side to max length
-        assert attachment_stage_side is not None
         attachment_center_offset = np.array([-attachment_stage_side[-1][0]-self.max_length/2, 0])
         return np.concatenate([self.dove_arc[:-1], attachment_stage_side]) + attachment_center_offset
     
@@ -201,6 +253,8 @@ class FirtreeAttachment:
         return np.abs(self.left_side[0][0])*2
 
     def visualize(self):
+        # plotly is only needed for visualization, keep it off the import path
+        import plotly.graph_objects as go
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=self.coords[:, 0],
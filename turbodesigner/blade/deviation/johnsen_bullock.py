@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from turbodesigner.airfoils import AirfoilType
+from turbodesigner.blade.metal_angle_methods.johnsen_bullock import JohnsenBullockMetalAngleMethod
+from turbodesigner.blade.metal_angles import MetalAngles
+
+
+@dataclass
+class JohnsenBullockBladeDeviation(JohnsenBullockMetalAngleMethod):
+    "Johnsen and Bullock 1965 blade deviation"
+
+    def get_metal_angles(self, iterations: int):
+        """metal angles with nominal incidence and deviation (MetalAngles)
+
+        Parameters
+        ==========
+
+        iterations: int
+            nominal deviation iterations
+
+        """
+        if iterations == 0:
+            return MetalAngles(self.beta1, self.beta2, 0.0, 0.0)
+        metal_angle_offset = self.get_metal_angle_offset(iterations)
+        return MetalAngles(self.beta1, self.beta2, metal_angle_offset.i, metal_angle_offset.delta)
+
+    @staticmethod
+    def get_metal_angles_batch(deviations: list["JohnsenBullockBladeDeviation"], iterations: int):
+        """metal angles of many blade rows solved in one threaded kernel call (list[MetalAngles])
+
+        Parameters
+        ==========
+
+        deviations: list[JohnsenBullockBladeDeviation]
+            blade deviations, e.g. one per blade row of a design sweep
+
+        iterations: int
+            nominal deviation iterations
+
+        """
+        offsets = JohnsenBullockMetalAngleMethod.get_metal_angle_offset_batch(list(deviations), iterations)
+        return [
+            MetalAngles(deviation.beta1, deviation.beta2, offset.i, offset.delta)
+            for deviation, offset in zip(deviations, offsets)
+        ]
@@ -1,12 +1,170 @@
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Union
+from numba import njit, prange
+import math
 import numpy as np
 from turbodesigner.airfoils import AirfoilType
-from turbodesigner.blade.metal_angles import MetalAngles
 
 
-@dataclass
+# C4 shares its enum value with DCA, so it resolves to the DCA entries
+BLADE_SHAPE_PARAMETER = {
+    AirfoilType.NACA65: 1.0,
+    AirfoilType.DCA: 0.7,
+}
+"blade shape parameter Ksh per airfoil type (dimensionless)"
+
+DEVIATION_SLOPE_COEFFICIENTS = {
+    AirfoilType.NACA65: (0.0, 0.333, -0.0333, 0.17),
+}
+"cubic coefficients (x**3, x**2, x, 1) of deviation slope factor m1 per airfoil type, x = beta1/100"
+
+CIRCULAR_ARC_DEVIATION_SLOPE_COEFFICIENTS = (0.316, -0.132, 0.074, 0.249)
+"cubic coefficients (x**3, x**2, x, 1) of deviation slope factor m1 for circular arc airfoils"
+
+ITERATE_SIGNATURE = "Tuple((float64[::1], float64[::1]))(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int64)"
+
+
+@dataclass(frozen=True, slots=True)
+class SigmaScalars:
+    "solidity dependent scalars of the Johnsen-Bullock correlations"
+
+    sigma_cubed: float
+    "solidity cubed (dimensionless)"
+
+    exp_sigma: float
+    "exp(-2.3*sigma) (dimensionless)"
+
+    n_exponent: float
+    "slope factor exponent 1.2*sigma + 1 (dimensionless)"
+
+    n_denominator: float
+    "slope factor denominator 0.43*sigma + 1.5 (dimensionless)"
+
+    delta_star_factor: float
+    "nominal deviation factor 0.74*sigma**1.9 + 3*sigma (dimensionless)"
+
+    delta_star_exponent: float
+    "nominal deviation exponent 1.09*sigma + 1.67 (dimensionless)"
+
+    p: float
+    "nominal incidence exponent (dimensionless)"
+
+    i_star_denominator: float
+    "nominal incidence denominator 5 + 46*exp(-2.3*sigma) (dimensionless)"
+
+
+@lru_cache(maxsize=128)
+def get_sigma_scalars(sigma: float):
+    """solidity dependent scalars, cached since design sweeps reuse few solidities (SigmaScalars)
+
+    Parameters
+    ==========
+
+    sigma: float
+        solidity (dimensionless)
+
+    """
+    sigma_cubed = sigma**3
+    exp_sigma = math.exp(-2.3*sigma)
+    return SigmaScalars(
+        sigma_cubed=sigma_cubed,
+        exp_sigma=exp_sigma,
+        n_exponent=1.2*sigma + 1,
+        n_denominator=0.43*sigma + 1.5,
+        delta_star_factor=(0.74*sigma**1.9) + 3*sigma,
+        delta_star_exponent=1.09*sigma + 1.67,
+        p=(1/160)*sigma_cubed + 0.914,
+        i_star_denominator=5 + 46*exp_sigma,
+    )
+
+
+@njit(cache=True)
+def _iterate_stream(beta1_deg, beta2_deg, n, m, i_star_base_deg, delta_star_base_deg, iterations):
+    "fixed-point iteration of nominal incidence and deviation for one stream, kept in registers (i_star_deg, delta_star_deg)"
+    i_star_deg = 0.0
+    delta_star_deg = 0.0
+    for _ in range(iterations):
+        # camber angle from metal angles kappa1 - kappa2 (deg)
+        theta_deg = (beta1_deg - i_star_deg) - (beta2_deg - delta_star_deg)
+        i_star_next_deg = theta_deg*n + i_star_base_deg
+        delta_star_next_deg = delta_star_base_deg + theta_deg*m
+        # fixed point reached to machine precision, remaining iterations are no-ops
+        if i_star_next_deg == i_star_deg and delta_star_next_deg == delta_star_deg:
+            break
+        i_star_deg = i_star_next_deg
+        delta_star_deg = delta_star_next_deg
+    return i_star_deg, delta_star_deg
+
+
+@njit(ITERATE_SIGNATURE, cache=True)
+def _iterate_metal_angle_offset(beta1_deg, beta2_deg, n, m, i_star_base_deg, delta_star_base_deg, iterations):
+    "fixed-point iteration of nominal incidence and deviation per stream (i_star_deg, delta_star_deg)"
+    i_star_deg = np.zeros_like(beta1_deg)
+    delta_star_deg = np.zeros_like(beta1_deg)
+    for k in range(beta1_deg.shape[0]):
+        i_star_deg[k], delta_star_deg[k] = _iterate_stream(
+            beta1_deg[k], beta2_deg[k], n[k], m[k], i_star_base_deg[k], delta_star_base_deg[k], iterations
+        )
+    return i_star_deg, delta_star_deg
+
+
+@njit(ITERATE_SIGNATURE, parallel=True, cache=True)
+def _iterate_metal_angle_offset_parallel(beta1_deg, beta2_deg, n, m, i_star_base_deg, delta_star_base_deg, iterations):
+    "fixed-point iteration of nominal incidence and deviation with streams split across threads (i_star_deg, delta_star_deg)"
+    i_star_deg = np.zeros_like(beta1_deg)
+    delta_star_deg = np.zeros_like(beta1_deg)
+    for k in prange(beta1_deg.shape[0]):
+        i_star_deg[k], delta_star_deg[k] = _iterate_stream(
+            beta1_deg[k], beta2_deg[k], n[k], m[k], i_star_base_deg[k], delta_star_base_deg[k], iterations
+        )
+    return i_star_deg, delta_star_deg
+
+
+def iterate_metal_angle_offset(
+    beta1_deg: Union[float, np.ndarray],
+    beta2_deg: Union[float, np.ndarray],
+    n: Union[float, np.ndarray],
+    m: Union[float, np.ndarray],
+    i_star_base_deg: Union[float, np.ndarray],
+    delta_star_base_deg: Union[float, np.ndarray],
+    iterations: int,
+    parallel: bool = False
+):
+    """fixed-point iteration of nominal incidence and deviation (i_star_deg, delta_star_deg)
+
+    Parameters
+    ==========
+
+    beta1_deg, beta2_deg: float | np.ndarray
+        inlet and outlet flow angle magnitudes (deg)
+
+    n, m: float | np.ndarray
+        incidence and deviation slope factors (dimensionless)
+
+    i_star_base_deg, delta_star_base_deg: float | np.ndarray
+        nominal incidence and deviation at zero camber (deg)
+
+    iterations: int
+        number of fixed-point iterations
+
+    parallel: bool
+        whether streams are split across threads, worthwhile for large batches
+
+    """
+    inputs = np.broadcast_arrays(beta1_deg, beta2_deg, n, m, i_star_base_deg, delta_star_base_deg)
+    shape = inputs[0].shape
+    kernel = _iterate_metal_angle_offset_parallel if parallel else _iterate_metal_angle_offset
+    i_star_deg, delta_star_deg = kernel(
+        *(np.ascontiguousarray(value, dtype=np.float64).ravel() for value in inputs),
+        int(iterations)
+    )
+    if shape == ():
+        return float(i_star_deg[0]), float(delta_star_deg[0])
+    return i_star_deg.reshape(shape), delta_star_deg.reshape(shape)
+
+
+@dataclass(slots=True)
 class MetalAngleOffset:
     i: Union[float, np.ndarray]
     "blade incidence (rad)"
@@ -35,21 +193,38 @@ class JohnsenBullockMetalAngleMethod:
     "airfoil type (AirfoilType)"
 
     def __post_init__(self):
-        self.beta1_deg = np.abs(np.degrees(self.beta1))
-        self.beta2_deg = np.abs(np.degrees(self.beta2))
-
-    @cached_property
-    def Ksh(self):
+        # airfoil type dependent factors are resolved once to plain floats
+        self.Ksh = BLADE_SHAPE_PARAMETER[self.airfoil_type]
         "blade shape paramter (dimensionless)"
-        match self.airfoil_type:
-            case AirfoilType.NACA65: return 1.0
-            case AirfoilType.DCA: return 0.7
-            case AirfoilType.C4: return 1.1
+        self.m1_coefficients = np.array(
+            DEVIATION_SLOPE_COEFFICIENTS.get(self.airfoil_type, CIRCULAR_ARC_DEVIATION_SLOPE_COEFFICIENTS)
+        )
+        "cubic coefficients (x**3, x**2, x, 1) of deviation slope factor m1 (dimensionless)"
+
+        # flow angle signs are reused to restore signed incidence and deviation
+        self.beta1_sign = np.sign(self.beta1)
+        self.beta2_sign = np.sign(self.beta2)
+
+        # flow angle magnitudes |beta| (deg)
+        self.beta1_deg = np.multiply(self.beta1, self.beta1_sign)
+        self.beta1_deg *= 180/np.pi
+        self.beta2_deg = np.multiply(self.beta2, self.beta2_sign)
+        self.beta2_deg *= 180/np.pi
+
+        # inlet angle powers shared by the slope factors and nominal angles
+        self.beta1_deg_90 = self.beta1_deg/90
+        self.x = self.beta1_deg/100
+        self.x2 = self.x*self.x
+        self.x3 = self.x2*self.x
+
+        # solidity terms shared by the slope factors and nominal angles
+        self.sigma_scalars = get_sigma_scalars(float(self.sigma))
 
     @cached_property
     def n(self):
         "slope factor (dimensionless)"
-        return 0.025*self.sigma - ((1/90)*self.beta1_deg)**(1.2*self.sigma + 1)/(0.43*self.sigma + 1.5) - 0.06
+        sigma_scalars = self.sigma_scalars
+        return 0.025*self.sigma - self.beta1_deg_90**sigma_scalars.n_exponent/sigma_scalars.n_denominator - 0.06
 
     @cached_property
     def kti(self):
@@ -60,15 +235,8 @@ class JohnsenBullockMetalAngleMethod:
     @cached_property
     def m(self):
         "deviation slope factor (dimensionless)"
-        x = (1/100)*self.beta1_deg
-
-        match self.airfoil_type:
-            case AirfoilType.NACA65:
-                m1 = 0.333*x**2 - 0.0333*x + 0.17
-            case _:
-                m1 = 0.316*x**3 - 0.132*x**2 + 0.074*x + 0.249
-
-        b = -0.85*x**3 - 0.17*x + 0.9625
+        m1 = np.polyval(self.m1_coefficients, self.x)
+        b = -0.85*self.x3 - 0.17*self.x + 0.9625
         return self.sigma**(-b)*m1
 
     @cached_property
@@ -79,14 +247,14 @@ class JohnsenBullockMetalAngleMethod:
     @cached_property
     def delta_star_0_10(self):
         "nominal deviation angle theta=0, tbc=0.10 (deg)"
-        return 0.01*self.beta1_deg*self.sigma + ((0.74*self.sigma**1.9) + 3*self.sigma)*(self.beta1_deg/90)**(1.09*self.sigma + 1.67)
+        sigma_scalars = self.sigma_scalars
+        return 0.01*self.beta1_deg*self.sigma + sigma_scalars.delta_star_factor*self.beta1_deg_90**sigma_scalars.delta_star_exponent
 
     @cached_property
     def i_star_0_10(self):
         "nominal incidence angle theta=0, tbc=0.10 (deg)"
-        # seal pitch (dimensionless)
-        p = (1/160)*self.sigma**3 + 0.914
-        return ((self.beta1_deg**p)/(5 + 46*np.exp(-2.3*self.sigma))) - 0.1*self.sigma**3*np.exp((self.beta1_deg - 70)/4)
+        sigma_scalars = self.sigma_scalars
+        return ((self.beta1_deg**sigma_scalars.p)/sigma_scalars.i_star_denominator) - 0.1*sigma_scalars.sigma_cubed*np.exp((self.beta1_deg - 70)/4)
 
     def get_i_star_deg(self, theta_deg: Union[float, np.ndarray]):
         "nominal incidence angle (deg)"
@@ -96,15 +264,56 @@ class JohnsenBullockMetalAngleMethod:
         "nominal deviation angle (deg)"
         return self.Ksh*self.Ktdelta*self.delta_star_0_10 + theta_deg*self.m
 
-    def get_metal_angle_offset(self, iterations: int):
-        i_star_deg, delta_star_deg = 0, 0
-        # TODO: make this more efficient with Numba
-        for _ in range(iterations):
-            metal_angles_deg = MetalAngles(self.beta1_deg, self.beta2_deg, i_star_deg, delta_star_deg)
-            theta_deg = metal_angles_deg.theta
-            i_star_deg = self.get_i_star_deg(theta_deg)
-            delta_star_deg = self.get_delta_star_deg(theta_deg)
-
-        i = np.radians(i_star_deg) * np.sign(self.beta1)
-        delta = np.radians(delta_star_deg) * np.sign(self.beta2)
+    def get_offset_inputs(self):
+        "fixed-point iteration inputs broadcast to a common shape (beta1_deg, beta2_deg, n, m, i_star_base_deg, delta_star_base_deg)"
+        return np.broadcast_arrays(
+            self.beta1_deg,
+            self.beta2_deg,
+            self.n,
+            self.m,
+            self.get_i_star_deg(0.0),
+            self.get_delta_star_deg(0.0),
+        )
+
+    def to_metal_angle_offset(self, i_star_deg: Union[float, np.ndarray], delta_star_deg: Union[float, np.ndarray]):
+        "signed incidence and deviation from nominal angle magnitudes (MetalAngleOffset)"
+        i = i_star_deg * (self.beta1_sign*(np.pi/180))
+        delta = delta_star_deg * (self.beta2_sign*(np.pi/180))
         return MetalAngleOffset(i, delta)
+
+    def get_metal_angle_offset(self, iterations: int):
+        i_star_deg, delta_star_deg = iterate_metal_angle_offset(*self.get_offset_inputs(), iterations)
+        return self.to_metal_angle_offset(i_star_deg, delta_star_deg)
+
+    @staticmethod
+    def get_metal_angle_offset_batch(methods: list["JohnsenBullockMetalAngleMethod"], iterations: int):
+        """metal angle offsets of many blade rows solved in one threaded kernel call (list[MetalAngleOffset])
+
+        Parameters
+        ==========
+
+        methods: list[JohnsenBullockMetalAngleMethod]
+            metal angle methods, e.g. one per blade row of a design sweep
+
+        iterations: int
+            nominal deviation iterations
+
+        """
+        inputs = [method.get_offset_inputs() for method in methods]
+        shapes = [method_inputs[0].shape for method_inputs in inputs]
+        stacked = [
+            np.concatenate([np.ravel(method_inputs[j]) for method_inputs in inputs])
+            for j in range(6)
+        ]
+        i_star_deg, delta_star_deg = iterate_metal_angle_offset(*stacked, iterations, parallel=True)
+
+        offsets = []
+        start = 0
+        for method, shape in zip(methods, shapes):
+            end = start + int(np.prod(shape))
+            method_i_star_deg, method_delta_star_deg = i_star_deg[start:end].reshape(shape), delta_star_deg[start:end].reshape(shape)
+            if shape == ():
+                method_i_star_deg, method_delta_star_deg = float(method_i_star_deg), float(method_delta_star_deg)
+            offsets.append(method.to_metal_angle_offset(method_i_star_deg, method_delta_star_deg))
+            start = end
+        return offsets
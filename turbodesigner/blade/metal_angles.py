@@ -3,7 +3,7 @@ from typing import Union
 import numpy as np
 from turbodesigner.units import DEG
 
-@dataclass
+@dataclass(slots=True)
 class MetalAngles:
 
     beta1: Union[float, np.ndarray]
@@ -31,7 +31,10 @@ class MetalAngles:
     "stagger angle (rad)"
 
     def __post_init__(self):
-        self.kappa1 = np.asfarray(self.beta1 - self.i)
-        self.kappa2 = np.asfarray(self.beta2 - self.delta)
-        self.theta = np.asfarray(self.kappa1-self.kappa2)
-        self.xi = np.asfarray((self.kappa1 + self.kappa2)/2)
\ No newline at end of file
+        self.kappa1 = np.asarray(np.subtract(self.beta1, self.i), dtype=np.float64)
+        self.kappa2 = np.asarray(np.subtract(self.beta2, self.delta), dtype=np.float64)
+        self.theta = np.subtract(self.kappa1, self.kappa2)
+
+        # mean of metal angles, halved in place on the one sum buffer
+        self.xi = np.add(self.kappa1, self.kappa2)
+        self.xi *= 0.5
\ No newline at end of file
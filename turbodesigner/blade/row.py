@@ -1,9 +1,10 @@
 from enum import Enum
-from functools import cached_property
+import math
+from functools import cached_property, lru_cache
 from dataclasses import dataclass
 from typing import Literal, Optional
 from turbodesigner.airfoils import AirfoilType, DCAAirfoil
-from turbodesigner.blade.metal_angle_methods.johnsen_bullock import JohnsenBullockMetalAngleMethod
+from turbodesigner.blade.deviation.johnsen_bullock import JohnsenBullockBladeDeviation
 from turbodesigner.blade.metal_angles import MetalAngles
 from turbodesigner.blade.vortex.common import Vortex
 from turbodesigner.flow_station import FlowStation
@@ -13,8 +14,83 @@ import numpy.typing as npt
 from turbodesigner.units import MM
 MetalAngleMethods = Literal["EqualsFlowAngles", "JohnsenBullock"]
 
+CAD_EXPORT_DTYPE = np.float32
+"dtype of exported CAD coordinate arrays, single precision is far below machining tolerance"
 
-@dataclass
+
+class cached_property_nolock:
+    "cached_property without the per-property lock, BladeRow is only evaluated from one thread"
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+@lru_cache(maxsize=128)
+def get_radii(rh: float, rt: float, N_stream: int):
+    """evenly spaced blade radii from hub to tip, read-only since they are shared between rows (m)
+
+    Parameters
+    ==========
+
+    rh, rt: float
+        blade hub and tip radius (m)
+
+    N_stream: int
+        number of streams (dimensionless)
+
+    """
+    radii = np.linspace(rh, rt, N_stream, endpoint=True)
+    radii.setflags(write=False)
+    return radii
+
+
+@lru_cache(maxsize=64)
+def get_firtree_attachment(s: float, disk_radius: float, include_top_arc: bool):
+    """firtree attachment of blade row, shared between rows with identical geometry inputs (FirtreeAttachment)
+
+    Parameters
+    ==========
+
+    s: float
+        spacing between blades (m)
+
+    disk_radius: float
+        disk radius at blade hub (m)
+
+    include_top_arc: bool
+        whether attachment includes top arc, rotating rows only
+
+    """
+    max_length = 0.75*s if include_top_arc else 1*s
+    return FirtreeAttachment(
+        gamma=np.radians(40),
+        beta=np.radians(40),
+        ll=0.15*s,
+        lu=0.2*s,
+        Ri=0.05*s,
+        Ro=0.025*s,
+        R_dove=0.05*s,
+        max_length=max_length,
+        num_stages=2,
+        disk_radius=disk_radius,
+        tolerance=0.0006,  # m, 0.5 mm
+        include_top_arc=include_top_arc
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class BladeRowCadExport:
     stage_number: int
     "stage number"
@@ -95,34 +171,41 @@ class BladeRow:
 
     def __post_init__(self):
         assert self.N_stream % 2 != 0, "N_stream must be an odd number"
-        if self.is_rotating and self.next_stage_flow_station is None:
-            self.next_stage_flow_station = self.stage_flow_station.copyStream(
-                alpha=self.vortex.alpha(self.radii, is_rotating=False),
-                radius=self.radii
-            )
-
-    @cached_property
+        if self.next_stage_flow_station is None:
+            if self.is_rotating:
+                self.next_stage_flow_station = self.stage_flow_station.copyStream(
+                    alpha=self.vortex_alpha[1],
+                    radius=self.radii
+                )
+            elif self.vortex.Rm == 0.5:
+                # repeating stage, stator outlet returns to rotor inlet angle (alpha3 = alpha1)
+                self.next_stage_flow_station = self.stage_flow_station.copyStream(
+                    alpha=self.vortex_alpha[0],
+                    radius=self.radii
+                )
+
+    @cached_property_nolock
     def rt(self):
         "blade tip radius (m)"
         rt = self.stage_flow_station.outer_radius
         assert isinstance(rt, float)
         return rt
 
-    @cached_property
+    @cached_property_nolock
     def rh(self):
         "blade hub radius (m)"
         rh = self.stage_flow_station.inner_radius
         assert isinstance(rh, float)
         return rh
 
-    @cached_property
+    @cached_property_nolock
     def rm(self):
         "blade mean radius (m)"
         rm = self.stage_flow_station.radius
         assert isinstance(rm, float)
         return rm
 
-    @cached_property
+    @cached_property_nolock
     def h(self):
         "height of blade (m)"
         return self.rt-self.rh
@@ -131,37 +214,38 @@ class BladeRow:
     def h_disk(self):
         "disk height of blade row (m)"
         xi = self.metal_angles.xi[0] if self.is_rotating else self.metal_angles.xi[-1]
-        return np.abs(self.c*np.cos(xi) * 1.25)
+        return abs(self.c*math.cos(xi)*1.25)
 
-    @cached_property
+    @cached_property_nolock
     def c(self):
         "chord length (m)"
         return self.h/self.AR
 
-    @cached_property
+    @cached_property_nolock
     def tb(self):
         "blade max thickness (m)"
         return self.tbc * self.c
 
-    @cached_property
+    @cached_property_nolock
     def Z(self):
         "number of blades in row (dimensionless)"
-        Z = np.ceil(2*np.pi*self.rm/(self.sc*self.c))
-        if not self.is_rotating and not Z % 2 == 0:
+        Z = math.ceil(2*math.pi*self.rm/(self.sc*self.c))
+        # stators use an even blade count
+        if not self.is_rotating and Z & 1:
             Z -= 1
-        return int(Z)
+        return Z
 
-    @cached_property
+    @cached_property_nolock
     def s(self):
         "spacing between blades (m)"
-        return 2*np.pi*self.rh/self.Z
+        return 2*math.pi*self.rh/self.Z
 
-    @cached_property
+    @cached_property_nolock
     def sh(self):
         "spacing to height (dimensionless)"
         return self.s/self.h
 
-    @cached_property
+    @cached_property_nolock
     def sigma(self):
         "spacing between blades (dimensionless)"
         return 1 / self.sc
@@ -176,7 +260,7 @@ class BladeRow:
         "Reynold's number of blade chord (dimensionless)"
         return self.stage_flow_station.rho * self.stage_flow_station.Vm * (self.c / self.stage_flow_station.mu)
 
-    @cached_property
+    @cached_property_nolock
     def airfoil_type(self):
         # if self.stage_flow_station.MN < 0.7:
         #     return AirfoilType.NACA65
@@ -189,24 +273,28 @@ class BladeRow:
 
     @cached_property
     def metal_angles(self):
-        if self.metal_angle_method == "JohnsenBullock":
+        if self.metal_angle_method == "JohnsenBullock" and self.deviation_iterations > 0:
             # beta1_rm: float = np.median(self.beta1)  # type: ignore
             # beta2_rm: float = np.median(self.beta2)  # type: ignore
-            method_angle_method = JohnsenBullockMetalAngleMethod(self.beta1, self.beta2, self.sigma, self.tbc, self.airfoil_type)
-            metal_angle_offset = method_angle_method.get_metal_angle_offset(self.deviation_iterations)
-            return MetalAngles(self.beta1, self.beta2, metal_angle_offset.i, metal_angle_offset.delta)
+            deviation = JohnsenBullockBladeDeviation(self.beta1, self.beta2, self.sigma, self.tbc, self.airfoil_type)
+            return deviation.get_metal_angles(self.deviation_iterations)
         return MetalAngles(self.beta1, self.beta2, 0, 0)
 
     @cached_property
     def radii(self):
         "blade radii (m)"
-        return np.linspace(self.rh, self.rt, self.N_stream, endpoint=True)
+        return get_radii(self.rh, self.rt, self.N_stream)
+
+    @cached_property
+    def vortex_alpha(self):
+        "vortex absolute flow angle at blade radii for rotating and stationary rows (rad)"
+        return self.vortex.alpha_pair(self.radii)
 
     @cached_property
     def flow_station(self):
         "flow station (FlowStation)"
         return self.stage_flow_station.copyStream(
-            alpha=self.vortex.alpha(self.radii, self.is_rotating),
+            alpha=self.vortex_alpha[0 if self.is_rotating else 1],
             radius=self.radii
         )
 
@@ -215,7 +303,7 @@ class BladeRow:
         "next flow station (FlowStation)"
         assert self.next_stage_flow_station is not None
         return self.next_stage_flow_station.copyStream(
-            alpha=self.vortex.alpha(self.radii, self.is_rotating),
+            alpha=self.vortex_alpha[0 if self.is_rotating else 1],
             radius=self.radii
         )
 
@@ -229,61 +317,49 @@ class BladeRow:
     @cached_property
     def beta2(self):
         "blade outlet flow angle (rad)"
+        assert self.next_stage_flow_station is not None, "next_flow_station needs to be defined or Rc=0.5"
         if self.is_rotating:
-            assert self.next_stage_flow_station is not None
-            return self.next_stage_flow_station.beta                      # beta2
+            return self.next_stage_flow_station.beta    # beta2
+        return self.next_stage_flow_station.alpha       # alpha3
 
-        assert self.next_stage_flow_station is not None or self.vortex.Rm == 0.5, "next_flow_station needs to be defined or Rc=0.5"
-        if self.next_stage_flow_station is not None:
-            return self.next_stage_flow_station.alpha                                    # alpha3
-        return self.vortex.alpha(self.radii, is_rotating=not self.is_rotating)           # alpha3
+    @cached_property
+    def beta_trig(self):
+        "cos and tan of blade inlet and outlet flow angles, tan from sin/cos (cos_beta1, tan_beta1, cos_beta2, tan_beta2)"
+        cos_beta1, cos_beta2 = np.cos(self.beta1), np.cos(self.beta2)
+        tan_beta1 = np.sin(self.beta1)/cos_beta1
+        tan_beta2 = np.sin(self.beta2)/cos_beta2
+        return cos_beta1, tan_beta1, cos_beta2, tan_beta2
 
     @cached_property
     def DF(self):
         "diffusion factor (dimensionless)"
-        return 1-(np.cos(self.beta1)/np.cos(self.beta2))+(np.cos(self.beta1)/2)*self.sigma*(np.tan(self.beta1)-np.tan(self.beta2))
+        cos_beta1, tan_beta1, cos_beta2, tan_beta2 = self.beta_trig
+        return 1-(cos_beta1/cos_beta2)+(cos_beta1/2)*self.sigma*(tan_beta1-tan_beta2)
 
     @cached_property
     def airfoils(self):
+        "airfoils for each blade radius evaluated together (DCAAirfoilBatch)"
         r0 = self.tb * 0.15
-        # TODO: optimize this with Numba
-        return [
-            DCAAirfoil(self.c, self.metal_angles.theta[i], r0, self.tb, self.metal_angles.xi[i])
-            for i in range(self.N_stream)
-        ]
+        return DCAAirfoil.batch(self.c, self.metal_angles.theta, r0, self.tb, self.metal_angles.xi)
 
     @cached_property
     def attachment(self):
-        max_length = 0.75*self.s if self.is_rotating else 1*self.s
-        attachment = FirtreeAttachment(
-            gamma=np.radians(40),
-            beta=np.radians(40),
-            ll=0.15*self.s,
-            lu=0.2*self.s,
-            Ri=0.05*self.s,
-            Ro=0.025*self.s,
-            R_dove=0.05*self.s,
-            max_length=max_length,
-            num_stages=2,
-            disk_radius=self.rh,
-            tolerance=0.0006,  # m, 0.5 mm
-            include_top_arc=self.is_rotating
-        )
-        return attachment
+        return get_firtree_attachment(float(self.s), float(self.rh), self.is_rotating)
 
     def to_cad_export(self):
+        # CAD geometry does not need double precision, scale to mm straight into float32 buffers
         return BladeRowCadExport(
             stage_number=self.stage_number,
             disk_height=self.h_disk * MM,
             hub_radius=self.rh * MM,
             tip_radius=self.rt * MM,
-            radii=self.radii * MM,
-            airfoils=np.array([airfoil.get_coords() for airfoil in self.airfoils]) * MM,
-            attachment=self.attachment.coords * MM,
-            attachment_with_tolerance=self.attachment.coords_with_tolerance * MM,
+            radii=np.multiply(self.radii, MM, dtype=CAD_EXPORT_DTYPE),
+            airfoils=np.multiply(self.airfoils.get_coords(), MM, dtype=CAD_EXPORT_DTYPE),
+            attachment=np.multiply(self.attachment.coords, MM, dtype=CAD_EXPORT_DTYPE),
+            attachment_with_tolerance=np.multiply(self.attachment.coords_with_tolerance, MM, dtype=CAD_EXPORT_DTYPE),
             attachment_height=self.attachment.height * MM,
             attachment_bottom_width=self.attachment.bottom_width * MM,
             number_of_blades=self.Z,
-            twist_angle=np.degrees(self.metal_angles.xi[-1]-self.metal_angles.xi[0]),
+            twist_angle=math.degrees(self.metal_angles.xi[-1]-self.metal_angles.xi[0]),
             is_rotating=self.is_rotating,
         )
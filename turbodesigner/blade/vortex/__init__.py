@@ -0,0 +1,4 @@
+from turbodesigner.blade.vortex.common import Vortex
+from turbodesigner.blade.vortex.free_vortex import FreeVortex
+
+__all__ = ["Vortex", "FreeVortex"]
@@ -1,8 +1,25 @@
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cached_property, wraps
 from typing import Union
 import numpy as np
 
+
+def radii_cache(method):
+    "caches a vortex method of radii per instance keyed by the radii values, results are read-only"
+    @wraps(method)
+    def wrapper(self, r: Union[float, np.ndarray]):
+        r = np.array(r, dtype=np.float64, ndmin=1)
+        cache = self.__dict__.setdefault("_radii_cache", {})
+        key = (method.__name__, r.tobytes())
+        value = cache.get(key)
+        if value is None:
+            value = method(self, r)
+            value.setflags(write=False)
+            cache[key] = value
+        return value
+    return wrapper
+
+
 @dataclass
 class Vortex:
     Um: float
@@ -29,4 +46,13 @@ class Vortex:
 
     def alpha(self, r: Union[float, np.ndarray], is_rotating: bool):
         "absolute flow angle (rad)"
-        return np.arctan(self.ctheta(r, is_rotating)/self.Vm)
\ No newline at end of file
+        return np.arctan2(self.ctheta(r, is_rotating), self.Vm)
+
+    def ctheta_pair(self, r: Union[float, np.ndarray]) -> np.ndarray:
+        "absolute tangential velocity for rotating and stationary rows stacked (m/s)"
+        return np.stack([np.atleast_1d(self.ctheta(r, True)), np.atleast_1d(self.ctheta(r, False))])
+
+    @radii_cache
+    def alpha_pair(self, r: Union[float, np.ndarray]) -> np.ndarray:
+        "absolute flow angle for rotating and stationary rows stacked (rad)"
+        return np.arctan2(self.ctheta_pair(r), self.Vm)
\ No newline at end of file
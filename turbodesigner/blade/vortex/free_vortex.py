@@ -1,11 +1,52 @@
 from typing import Union
+import math
 import numpy as np
-from turbodesigner.blade.vortex.common import Vortex
+from numba import njit
+from turbodesigner.blade.vortex.common import Vortex, radii_cache
+
+
+@njit("float64[:, ::1](float64[::1], float64, float64, float64)", cache=True)
+def free_vortex_alpha_pair(r: np.ndarray, rctheta_rotating: float, rctheta_stationary: float, Vm: float):
+    """absolute flow angle for rotating and stationary rows stacked, fused in one loop over radii (rad)
+
+    Parameters
+    ==========
+
+    r: np.ndarray
+        radii (m)
+
+    rctheta_rotating, rctheta_stationary: float
+        free vortex constant r*ctheta for rotor and stator inlet (m**2/s)
+
+    Vm: float
+        meridional flow velocity (m/s)
+
+    """
+    alpha = np.empty((2, r.shape[0]))
+    for i in range(r.shape[0]):
+        alpha[0, i] = math.atan2(rctheta_rotating/r[i], Vm)
+        alpha[1, i] = math.atan2(rctheta_stationary/r[i], Vm)
+    return alpha
+
 
 class FreeVortex(Vortex):
-    def ctheta(self, r: Union[float, np.ndarray], is_rotating: bool):
-        mu = r/self.rm
+    def __post_init__(self):
+        super().__post_init__()
         a = self.Um*(1-self.Rm)
         b = (1/2)*self.psi_m*self.Um
-        sign = -1 if is_rotating else 1
-        return (a/mu) + sign*(b/mu)
\ No newline at end of file
+
+        # free vortex constant r*ctheta for rotor and stator inlet (m**2/s)
+        self.rctheta_rotating = (a - b)*self.rm
+        self.rctheta_stationary = (a + b)*self.rm
+        self.rctheta_pair = np.array([[self.rctheta_rotating], [self.rctheta_stationary]])
+
+    def ctheta(self, r: Union[float, np.ndarray], is_rotating: bool):
+        rctheta = self.rctheta_rotating if is_rotating else self.rctheta_stationary
+        return rctheta/r
+
+    def ctheta_pair(self, r: Union[float, np.ndarray]):
+        return self.rctheta_pair/np.atleast_1d(r)
+
+    @radii_cache
+    def alpha_pair(self, r: Union[float, np.ndarray]):
+        return free_vortex_alpha_pair(r, float(self.rctheta_rotating), float(self.rctheta_stationary), float(self.Vm))
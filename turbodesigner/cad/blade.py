@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from functools import cached_property
 import cadquery as cq
-import numpy as np
+import math
 from turbodesigner.blade.row import BladeRowCadExport
 from turbodesigner.cad.common import ExtendedWorkplane, FastenerPredicter
 
@@ -45,30 +45,27 @@ class BladeCadModel:
         base_assembly = cq.Assembly()
         fastener_assembly = cq.Assembly()
 
+        # hub airfoil bounding box center, subtracted from all stations in one broadcast
         start_airfoil = self.blade_row.airfoils[0]
-        airfoil_vertical_offset = np.array([
-            (np.max(start_airfoil[:, 0]) + np.min(start_airfoil[:, 0]))/2,
-            (np.max(start_airfoil[:, 1]) + np.min(start_airfoil[:, 1]))/2
-        ])
-
-        # Hub Airfoil
-        blade_profile = (
-            cq.Workplane("XY")
-            .polyline(start_airfoil - airfoil_vertical_offset)
-            .close()
-        )
-
-        # Add all airfoil stations
-        for i in range(0, len(self.blade_row.radii) - 1):
+        airfoil_vertical_offset = start_airfoil.min(axis=0)
+        airfoil_vertical_offset += start_airfoil.max(axis=0)
+        airfoil_vertical_offset *= 0.5
+        # stations as nested float lists in one C-level pass, polyline converts points to OCC vertices one by one
+        airfoils = (self.blade_row.airfoils - airfoil_vertical_offset).tolist()
+
+        # Add all airfoil stations from hub, each on an absolute plane at its height above the hub airfoil
+        section_heights = (self.blade_row.radii - self.blade_row.radii[0]).tolist()
+        blade_profile = cq.Workplane("XY")
+        for section_height, airfoil in zip(section_heights, airfoils):
             blade_profile = (
                 blade_profile
-                .transformed(offset=cq.Vector(0, 0, self.blade_row.radii[i+1]-self.blade_row.radii[i]))
-                .polyline(self.blade_row.airfoils[i+1] - airfoil_vertical_offset)
+                .copyWorkplane(cq.Workplane(cq.Plane(origin=(0, 0, section_height), xDir=(1, 0, 0), normal=(0, 0, 1))))
+                .polyline(airfoil)
                 .close()
             )
 
         if self.blade_row.is_rotating:
-            hub_height_offset = self.blade_row.hub_radius*np.cos((2*np.pi / self.blade_row.number_of_blades) / 2)-self.blade_row.hub_radius
+            hub_height_offset = self.blade_row.hub_radius*math.cos((2*math.pi / self.blade_row.number_of_blades) / 2)-self.blade_row.hub_radius
         else:
             hub_height_offset = 0
 
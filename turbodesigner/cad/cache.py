@@ -0,0 +1,187 @@
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Optional
+import cadquery as cq
+import hashlib
+import json
+import os
+
+CAD_CACHE_FORMAT = 2
+"cached assembly file format, bumped whenever the layout of cached files changes"
+
+CAD_CACHE_PACKAGES = ("cadquery", "cadquery-ocp", "cq_warehouse")
+"packages whose versions invalidate cached assemblies"
+
+
+def get_package_version(package: str):
+    """installed package version, empty if it is not installed (str)
+
+    Parameters
+    ==========
+
+    package: str
+        package distribution name
+
+    """
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def get_source_fingerprint():
+    "cache format, cad package versions and turbodesigner source modification times, read once per process (str)"
+    fingerprint = [f"format={CAD_CACHE_FORMAT}"]
+    for package in CAD_CACHE_PACKAGES:
+        fingerprint.append(f"{package}={get_package_version(package)}")
+
+    package_dir = os.path.dirname(os.path.dirname(__file__))
+    for source_dir, _, file_names in sorted(os.walk(package_dir)):
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py"):
+                source_path = os.path.join(source_dir, file_name)
+                fingerprint.append(f"{os.path.relpath(source_path, package_dir)}={os.path.getmtime(source_path)}")
+    return "\n".join(fingerprint)
+
+
+def get_json_value(value: Any):
+    "numpy arrays and scalars as plain lists and numbers for deterministic JSON"
+    return value.tolist()
+
+
+def get_cad_cache_key(*inputs: Any):
+    """cached assembly key from JSON of input values and the source fingerprint (str)
+
+    Parameters
+    ==========
+
+    inputs: Any
+        cad export dataclasses and plain values the cached assembly is a pure function of
+
+    """
+    input_values = [asdict(value) if is_dataclass(value) else value for value in inputs]
+    key = hashlib.sha256(json.dumps(input_values, sort_keys=True, default=get_json_value).encode())
+    key.update(get_source_fingerprint().encode())
+    return key.hexdigest()
+
+
+def get_assembly_node(assembly: cq.Assembly, shapes: list[cq.Shape], shape_indices: dict[int, int]):
+    """assembly tree without geometry, shapes are appended once and referenced by index (dict)
+
+    Parameters
+    ==========
+
+    assembly: cq.Assembly
+        assembly to flatten
+
+    shapes: list[cq.Shape]
+        unique shapes of assembly tree, appended in place
+
+    shape_indices: dict[int, int]
+        shape index by shape object id, sub assemblies added several times share their shapes
+
+    """
+    node_shape_indices = []
+    for shape in assembly.shapes:
+        if id(shape) not in shape_indices:
+            shape_indices[id(shape)] = len(shapes)
+            shapes.append(shape)
+        node_shape_indices.append(shape_indices[id(shape)])
+
+    return {
+        "name": assembly.name,
+        "loc": assembly.loc.toTuple(),
+        "color": None if assembly.color is None else assembly.color.toTuple(),
+        "shapes": node_shape_indices,
+        "children": [get_assembly_node(child, shapes, shape_indices) for child in assembly.children],
+    }
+
+
+def get_node_assembly(node: dict, shapes: list[cq.Shape]) -> cq.Assembly:
+    """assembly rebuilt from an assembly tree and its shapes (cq.Assembly)
+
+    Parameters
+    ==========
+
+    node: dict
+        assembly tree from get_assembly_node
+
+    shapes: list[cq.Shape]
+        unique shapes of assembly tree
+
+    """
+    node_shapes = [shapes[i] for i in node["shapes"]]
+    obj = None
+    if len(node_shapes) == 1:
+        obj = node_shapes[0]
+    elif node_shapes:
+        obj = cq.Compound.makeCompound(node_shapes)
+
+    assembly = cq.Assembly(
+        obj,
+        loc=cq.Location(*node["loc"][0], *node["loc"][1]),
+        name=node["name"],
+        color=None if node["color"] is None else cq.Color(*node["color"]),
+    )
+    for child in node["children"]:
+        child_assembly = get_node_assembly(child, shapes)
+        assembly.add(child_assembly, name=child_assembly.name, loc=child_assembly.loc)
+    return assembly
+
+
+def read_cached_assembly(cache_dir: str, key: str) -> Optional[cq.Assembly]:
+    """cached assembly, None if it was not cached yet (cq.Assembly)
+
+    Parameters
+    ==========
+
+    cache_dir: str
+        directory of cached assemblies
+
+    key: str
+        cached assembly key
+
+    """
+    cache_path = os.path.join(os.path.expanduser(cache_dir), key)
+    # tree file is written last so its presence marks a complete entry
+    if not os.path.exists(f"{cache_path}.json"):
+        return None
+    with open(f"{cache_path}.json", "r") as tree_file:
+        node = json.load(tree_file)
+    with open(f"{cache_path}.brep", "rb") as brep_file:
+        shapes = list(cq.Shape.importBrep(brep_file))
+    return get_node_assembly(node, shapes)
+
+
+def write_cached_assembly(cache_dir: str, key: str, assembly: cq.Assembly):
+    """caches assembly geometry as one BRep compound of its unique shapes beside a JSON tree of names, locations and colors
+
+    Parameters
+    ==========
+
+    cache_dir: str
+        directory of cached assemblies
+
+    key: str
+        cached assembly key
+
+    assembly: cq.Assembly
+        assembly to cache
+
+    """
+    cache_path = os.path.join(os.path.expanduser(cache_dir), key)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+    shapes: list[cq.Shape] = []
+    node = get_assembly_node(assembly, shapes, {})
+
+    # written to temporary files first so readers never see partial entries
+    temporary_suffix = f".{os.getpid()}.tmp"
+    with open(f"{cache_path}.brep{temporary_suffix}", "wb") as brep_file:
+        cq.Compound.makeCompound(shapes).exportBrep(brep_file)
+    with open(f"{cache_path}.json{temporary_suffix}", "w") as tree_file:
+        json.dump(node, tree_file)
+    os.replace(f"{cache_path}.brep{temporary_suffix}", f"{cache_path}.brep")
+    os.replace(f"{cache_path}.json{temporary_suffix}", f"{cache_path}.json")
@@ -1,12 +1,13 @@
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Optional
+from turbodesigner.cad.cache import get_cad_cache_key, read_cached_assembly, write_cached_assembly
 from turbodesigner.cad.blade import BladeCadModel, BladeCadModelSpecification
-from turbodesigner.cad.common import ExtendedWorkplane, FastenerPredicter
+from turbodesigner.cad.common import INWARD_RADIAL_HOLE_LOCATION, ExtendedWorkplane, FastenerPredicter, get_polar_locations
 from turbodesigner.turbomachinery import TurbomachineryCadExport
 from turbodesigner.stage import StageCadExport
 import cadquery as cq
-import numpy as np
+import math
 
 
 @dataclass
@@ -47,6 +48,9 @@ class CasingCadModel:
     spec: CasingCadModelSpecifciation = field(default_factory=CasingCadModelSpecifciation)
     "casing cad model specification"
 
+    previous_casing_cad_model: Optional["CasingCadModel"] = field(default=None, repr=False)
+    "previous stage casing cad model, reused for its connect dimensions instead of being rebuilt from previous_stage"
+
     def __post_init__(self):
         self.stage_connect_heatset = FastenerPredicter.predict_heatset(
             target_diameter=self.stage.rotor.disk_height*self.spec.stage_connect_heatset_diameter_to_disk_height,
@@ -56,14 +60,6 @@ class CasingCadModel:
         stage_connect_padding = self.spec.stage_connect_padding_to_attachment_height * self.stage.stator.attachment_height
         self.stage_connect_length = self.casing_thickness - stage_connect_padding - self.stage.stator.attachment_height
 
-        self.blade_cad_model = BladeCadModel(
-            self.stage.stator,
-            spec=BladeCadModelSpecification(
-                not self.spec.is_simple,
-                screw_length_padding=self.casing_thickness-self.stage.stator.attachment_height
-            )
-        )
-
         self.stage_connect_screw = FastenerPredicter.predict_screw(
             target_diameter=self.stage_connect_heatset.thread_diameter,
             target_length=self.stage_connect_length+self.stage_connect_heatset.nut_thickness
@@ -73,13 +69,9 @@ class CasingCadModel:
         self.stage_connect_outer_radius = self.casing_radius
         self.stage_connect_inner_radius = self.stage_connect_outer_radius-self.stage_connect_length
 
-        self.previous_stage_casing_cad_model: Optional[CasingCadModel] = None
-        if self.previous_stage:
-            self.previous_stage_casing_cad_model = CasingCadModel(self.previous_stage, self.first_stage, spec=self.spec)
-
         # Half Connector
         self.sector_angle = 360 / self.stage.stator.number_of_blades
-        self.half_connect_thickness = self.casing_radius*np.sin(np.radians(self.sector_angle) / 2)
+        self.half_connect_thickness = self.casing_radius*math.sin(math.radians(self.sector_angle) / 2)
         self.half_connect_width = self.casing_thickness*self.spec.half_connect_width_to_casing_thickness
         self.half_connect_height = self.stage.stage_height + self.stage.row_gap
         self.half_connect_heatset = FastenerPredicter.predict_heatset(
@@ -90,33 +82,51 @@ class CasingCadModel:
             target_length=self.half_connect_thickness*0.75+self.half_connect_heatset.nut_thickness
         )
 
+    @cached_property
+    def blade_cad_model(self):
+        "stator blade cad model (BladeCadModel)"
+        return BladeCadModel(
+            self.stage.stator,
+            spec=BladeCadModelSpecification(
+                not self.spec.is_simple,
+                screw_length_padding=self.casing_thickness-self.stage.stator.attachment_height
+            )
+        )
+
+    @cached_property
+    def previous_stage_casing_cad_model(self) -> Optional["CasingCadModel"]:
+        "previous stage casing cad model, the given one or one built for previous_stage (CasingCadModel)"
+        if self.previous_stage is None:
+            return None
+        if self.previous_casing_cad_model is not None:
+            assert self.previous_casing_cad_model.stage is self.previous_stage, "previous casing cad model must be built for previous stage"
+            return self.previous_casing_cad_model
+        return CasingCadModel(self.previous_stage, self.first_stage, spec=self.spec)
+
     @cached_property
     def casing_stage_assembly(self):
         base_assembly = cq.Assembly()
         blade_assembly = cq.Assembly()
         fastener_assembly = cq.Assembly()
 
+        # cutter only, left uncleaned since the casing cut cleans the result once
+        # stator disk, transition cone and rotor disk revolved from one half section in a single operation
+        stator_disk_top = self.stage.stator.disk_height+self.stage.stage_gap
+        rotor_disk_bottom = stator_disk_top+self.stage.row_gap
+        rotor_disk_top = rotor_disk_bottom+self.stage.rotor.disk_height
         casing_cut_profile = (
-            # Stator Disk
-            ExtendedWorkplane("XY")
-            .transformed(offset=(0, 0, -self.stage_connect_height))
-            .circle(self.stage.stator.tip_radius*1.001)
-            .extrude(self.stage.stator.disk_height+self.stage.stage_gap+self.stage_connect_height)
-
-            # Transition Disk
-            .faces(">Z")
-            .workplane()
-            .truncated_cone(
-                start_radius=self.stage.stator.tip_radius,
-                end_radius=self.stage.rotor.tip_radius,
-                height=self.stage.row_gap
-            )
-
-            # Rotor Disk
-            .faces(">Z")
-            .workplane()
-            .circle(self.stage.rotor.tip_radius)
-            .extrude(self.stage.rotor.disk_height)
+            ExtendedWorkplane("XZ")
+            .polyline([
+                (0, -self.stage_connect_height),
+                (self.stage.stator.tip_radius*1.001, -self.stage_connect_height),
+                (self.stage.stator.tip_radius*1.001, stator_disk_top),
+                (self.stage.stator.tip_radius, stator_disk_top),
+                (self.stage.rotor.tip_radius, rotor_disk_bottom),
+                (self.stage.rotor.tip_radius, rotor_disk_top),
+                (0, rotor_disk_top),
+            ])
+            .close()
+            .revolve(360, (0, 0, 0), (0, 1, 0), clean=False)
         )
 
         casing_profile = (
@@ -150,30 +160,37 @@ class CasingCadModel:
         )
 
         if not self.spec.is_simple:
-            casing_profile = (
+            # Cut Attachments - one attachment prism located at every blade and removed in a single boolean cut
+            attachment_workplane = (
                 casing_profile
-                # Cut Attachments - TODO: make this operation faster
                 .faces("<Z")
                 .workplane(offset=-self.stage_connect_height)
                 .transformed(rotate=(0, 0, -self.sector_angle/2))
                 .polarArray(self.stage.stator.tip_radius, 0, 360, self.stage.stator.number_of_blades)
-                .eachpoint(
-                    lambda loc: (
-                        cq.Workplane("XY")
-                        .polyline(self.stage.stator.attachment_with_tolerance)  # type: ignore
-                        .close()
-                        .rotate((0, 0, 0), (0, 0, 1), 90)
-
-                    ).val().located(loc), True)  # type: ignore
-                .cutBlind(-self.stage.stator.disk_height)
+            )
+            # polar array locations are local to the workplane
+            attachment_locs = [attachment_workplane.plane.location * loc for loc in attachment_workplane.vals()]
+            attachment_cutter = (
+                cq.Workplane("XY")
+                .polyline(self.stage.stator.attachment_with_tolerance)  # type: ignore
+                .close()
+                .extrude(-self.stage.stator.disk_height)
+                .rotate((0, 0, 0), (0, 0, 1), 90)
+            ).val()
+            casing_profile = casing_profile.cut(
+                cq.Compound.makeCompound([attachment_cutter.located(loc) for loc in attachment_locs])  # type: ignore
+            )
 
+            # hole cuts only clean when no later cutBlind cleans the casing again
+            casing_profile = (
+                casing_profile
                 # Blade Lock Screws
                 .faces("<Z")
                 .workplane(offset=-self.stage_connect_height-self.stage.stator.attachment_height)
                 .transformed(rotate=(0, 0, -self.sector_angle/2))
                 .polarArray(self.stage_connect_outer_radius, 0, 360, self.stage.stator.number_of_blades)
-                .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 90))
-                .clearanceHole(self.blade_cad_model.lock_screw, depth=self.blade_cad_model.lock_screw.length, fit="Loose", baseAssembly=fastener_assembly)
+                .mutatePoints(INWARD_RADIAL_HOLE_LOCATION)
+                .clearanceHole(self.blade_cad_model.lock_screw, depth=self.blade_cad_model.lock_screw.length, fit="Loose", baseAssembly=fastener_assembly, clean=False)
 
                 # Stage Shaft Connect
                 .faces("<Z")
@@ -186,8 +203,8 @@ class CasingCadModel:
                 .workplane(offset=-self.stage_connect_height/2)
                 .transformed(rotate=(0, 0, 45))
                 .polarArray(self.stage_connect_outer_radius, 0, 360, self.spec.stage_connect_screw_quantity)
-                .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 90))
-                .clearanceHole(self.stage_connect_screw, fit="Loose", baseAssembly=fastener_assembly)
+                .mutatePoints(INWARD_RADIAL_HOLE_LOCATION)
+                .clearanceHole(self.stage_connect_screw, fit="Loose", baseAssembly=fastener_assembly, clean=self.previous_stage_casing_cad_model is None)
             )
             if self.previous_stage_casing_cad_model:
                 casing_profile = (
@@ -204,15 +221,26 @@ class CasingCadModel:
                     .workplane(offset=-self.previous_stage_casing_cad_model.stage_connect_height/2)
                     .transformed(rotate=(0, 0, 45))
                     .polarArray(self.previous_stage_casing_cad_model.stage_connect_inner_radius, 0, 360, self.spec.stage_connect_screw_quantity)
-                    .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 90))
+                    .mutatePoints(INWARD_RADIAL_HOLE_LOCATION)
                     .insertHole(self.previous_stage_casing_cad_model.stage_connect_heatset, fit="Loose", baseAssembly=fastener_assembly, depth=self.previous_stage_casing_cad_model.stage_connect_heatset.nut_thickness)
                 )
 
         if not self.spec.is_simple:
+            # both halves from one splitter pass with the split plane instead of a half space cut per half
+            split_workplane = casing_profile.transformed(rotate=(90, -45, 0))
+            split_plane = split_workplane.plane
+            split_size = split_workplane.findSolid().BoundingBox().DiagonalLength*2
+            casing_pieces = split_workplane.split(cq.Face.makePlane(split_size, split_size, split_plane.origin, split_plane.zDir)).solids().vals()
+            # cuts may leave several solids on a side, each side becomes one compound like the half space split
+            left_casing_pieces = [piece for piece in casing_pieces if (piece.Center() - split_plane.origin).dot(split_plane.zDir) < 0]  # type: ignore
+            right_casing_pieces = [piece for piece in casing_pieces if (piece.Center() - split_plane.origin).dot(split_plane.zDir) >= 0]  # type: ignore
+            assert left_casing_pieces and right_casing_pieces, "casing split plane must cross the casing"
+            left_casing_half = cq.Compound.makeCompound(left_casing_pieces)  # type: ignore
+            right_casing_half = cq.Compound.makeCompound(right_casing_pieces)  # type: ignore
+
             left_casing_profile = (
-                casing_profile
-                .transformed(rotate=(90, -45, 0))
-                .split(keepBottom=True)
+                split_workplane
+                .newObject([left_casing_half])
                 .faces("<Z")
                 .workplane()
                 .transformed(rotate=(-90, 0, 0), offset=(0, 0, -self.half_connect_height/2))
@@ -222,9 +250,8 @@ class CasingCadModel:
             )
 
             right_casing_profile = (
-                casing_profile
-                .transformed(rotate=(90, 135, 0))
-                .split(keepBottom=True)
+                split_workplane
+                .newObject([right_casing_half])
                 .faces("<Z")
                 .workplane()
                 .transformed(rotate=(-90, 0, 180), offset=(0, self.half_connect_thickness, -self.half_connect_height/2))
@@ -239,16 +266,15 @@ class CasingCadModel:
             base_assembly.add(casing_profile, name=f"Casing")
 
         blade_vertical_offset = self.stage.stator.disk_height/2
-        blade_assembly_locs = (
-            ExtendedWorkplane("XY")
-            .polarArray(self.stage.stator.hub_radius, 0, 360, self.stage.stator.number_of_blades)
-            .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, blade_vertical_offset), cq.Vector(0, 1, 0), 90))
-            .vals()
+        blade_assembly_locs = get_polar_locations(
+            self.stage.stator.hub_radius,
+            self.stage.stator.number_of_blades,
+            cq.Location(cq.Vector(0, 0, blade_vertical_offset), cq.Vector(0, 1, 0), 90)
         )
 
+        stage_blade_assembly = self.blade_cad_model.blade_assembly
         for (i, blade_assembly_loc) in enumerate(blade_assembly_locs):
-            assert isinstance(blade_assembly_loc, cq.Location)
-            blade_assembly.add(self.blade_cad_model.blade_assembly, loc=blade_assembly_loc, name=f"Blade {i+1}")
+            blade_assembly.add(stage_blade_assembly, loc=blade_assembly_loc, name=f"Blade {i+1}")
         blade_assembly.rotate((0, 0, 1), -self.sector_angle/2)  # type: ignore
 
         base_assembly.add(blade_assembly, name="Blades")
@@ -259,17 +285,47 @@ class CasingCadModel:
     @staticmethod
     def casing_assembly(
         turbomachinery: TurbomachineryCadExport,
-        spec: CasingCadModelSpecifciation = CasingCadModelSpecifciation()
+        spec: CasingCadModelSpecifciation = CasingCadModelSpecifciation(),
+        cache_dir: Optional[str] = None
     ):
+        """casing assembly of all stages (cq.Assembly)
+
+        Parameters
+        ==========
+
+        turbomachinery: TurbomachineryCadExport
+            turbomachinery cad export
+
+        spec: CasingCadModelSpecifciation
+            casing cad model specification
+
+        cache_dir: Optional[str]
+            directory of stage assemblies reused across runs such as ~/.cache/turbodesigner/casing, nothing is cached if None
+
+        """
+        stages = turbomachinery.stages
+        first_stage = stages[0]
+        previous_stages: list[Optional[StageCadExport]] = [None, *stages[:-1]]
+
+        stage_assemblies = []
+        previous_casing_cad_model: Optional[CasingCadModel] = None
+        for current_stage, previous_stage in zip(stages, previous_stages):
+            # each model reuses the previous one for its connect dimensions
+            casing_cad_model = CasingCadModel(current_stage, first_stage, previous_stage, spec, previous_casing_cad_model)
+            stage_assembly: Optional[cq.Assembly] = None
+            if cache_dir is not None:
+                cache_key = get_cad_cache_key("casing", current_stage, first_stage, previous_stage, spec)
+                stage_assembly = read_cached_assembly(cache_dir, cache_key)
+            if stage_assembly is None:
+                stage_assembly = casing_cad_model.casing_stage_assembly
+                if cache_dir is not None:
+                    write_cached_assembly(cache_dir, cache_key, stage_assembly)
+            stage_assemblies.append(stage_assembly)
+            previous_casing_cad_model = casing_cad_model
+
         assembly = cq.Assembly()
         stage_height_offset = 0
-        first_stage = turbomachinery.stages[0]
-        previous_stage: Optional[StageCadExport] = None
-        for i in range(0, len(turbomachinery.stages)):
-            current_stage = turbomachinery.stages[i]
-
+        for current_stage, stage_assembly in zip(stages, stage_assemblies):
             stage_height_offset -= current_stage.stage_height + current_stage.stage_gap + current_stage.row_gap
-            casing_cad_model = CasingCadModel(current_stage, first_stage, previous_stage, spec)
-            assembly.add(casing_cad_model.casing_stage_assembly, loc=cq.Location(cq.Vector(0, 0, stage_height_offset)), name=f"Stage {current_stage.stage_number}")
-            previous_stage = current_stage
+            assembly.add(stage_assembly, loc=cq.Location(cq.Vector(0, 0, stage_height_offset)), name=f"Stage {current_stage.stage_number}")
         return assembly
@@ -1,10 +1,22 @@
-from typing import Callable, List, Optional
+from functools import lru_cache
+from typing import Callable, List, Optional, Union
 import cadquery as cq
 import cq_warehouse.extensions as cq_warehouse_extensions
 from cq_warehouse.fastener import SocketHeadCapScrew, HeatSetNut
+from numba import njit
 import numpy as np
+import math
 import re
 
+NOMINAL_SIZE_PATTERN = re.compile(r"M?([\d.]+)")
+"nominal diameter of size names such as M3-0.5"
+
+INWARD_RADIAL_HOLE_LOCATION = cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 90)
+"turns polar array points so holes bore radially inward"
+
+OUTWARD_RADIAL_HOLE_LOCATION = cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), -90)
+"turns polar array points so holes bore radially outward"
+
 
 class ExtendedWorkplane(cq.Workplane):
     clearanceHole = cq_warehouse_extensions._clearanceHole
@@ -21,18 +33,15 @@ class ExtendedWorkplane(cq.Workplane):
             .extrude(depth)
         )
 
-    def truncated_cone(self, start_radius: float, end_radius: float, height: float):
-        plane_world_coords = self.plane.toWorldCoords((0, 0, 0))
-        path = cq.Workplane("XZ").moveTo(0, plane_world_coords.z).lineTo(0, height + plane_world_coords.z)
+    def truncated_cone(self, start_radius: float, end_radius: float, height: float, clean: bool = True):
+        # analytic cone primitive along workplane normal, OCC cones need distinct radii so equal radii make a cylinder
+        if start_radius == end_radius:
+            cone = cq.Solid.makeCylinder(start_radius, height, self.plane.origin, self.plane.zDir)
+        else:
+            cone = cq.Solid.makeCone(start_radius, end_radius, height, self.plane.origin, self.plane.zDir)
 
-        return (
-            self
-            .circle(start_radius)
-            .transformed(offset=cq.Vector(0, 0, height))
-            .circle(end_radius)
-            .sweep(path, multisection=True, makeSolid=True)
-            .clean()
-        )
+        # single optional clean pass, cutter geometry does not need one
+        return self._combineWithBase(cone, True, clean)
 
     def hollow_truncated_cone(self, inner_start_radius: float, inner_end_radius: float, height: float, start_thickness: float, end_thickness: float):
         outer_radius = inner_start_radius + start_thickness
@@ -41,32 +50,127 @@ class ExtendedWorkplane(cq.Workplane):
             .truncated_cone(outer_radius, outer_radius, height)
             .cut(
                 ExtendedWorkplane("XY")
-                .truncated_cone(inner_start_radius, inner_end_radius, height)
+                .truncated_cone(inner_start_radius, inner_end_radius, height, clean=False)
             )
         )
 
-    def mutatePoints(self, callback: Callable[[cq.Location], cq.Location]):
-        for (i, loc) in enumerate(self.objects):
-            if isinstance(loc, cq.Vertex) or isinstance(loc, cq.Vector):
+    def mutatePoints(self, transform: Union[cq.Location, Callable[[cq.Location], cq.Location]]):
+        "applies transform to every stack point, a constant location is multiplied in each point's local frame"
+        locs = []
+        for loc in self.objects:
+            # polar and rect arrays already push locations, only points need converting
+            if not isinstance(loc, cq.Location):
+                assert isinstance(loc, (cq.Vertex, cq.Vector))
                 loc = cq.Location(self.plane, loc.toTuple())
+            locs.append(loc)
 
-            assert isinstance(loc, cq.Location)
-            mutated_loc = callback(loc)
-            self.objects[i] = mutated_loc
-
+        if isinstance(transform, cq.Location):
+            self.objects[:] = [loc * transform for loc in locs]
+        else:
+            self.objects[:] = [transform(loc) for loc in locs]
         return self
  
 
+def get_polar_locations(radius: float, count: int, transform: cq.Location):
+    """locations of a full polar array on the XY plane with a constant transform in each local frame, same as polarArray then mutatePoints (list[cq.Location])
+
+    Parameters
+    ==========
+
+    radius: float
+        polar array radius
+
+    count: int
+        number of locations
+
+    transform: cq.Location
+        transform applied in each location's frame
+
+    """
+    angle = 360 / count
+    locs = []
+    for i in range(count):
+        phi_deg = angle * i
+        phi = math.radians(phi_deg)
+        locs.append(cq.Location(cq.Vector(radius*math.cos(phi), radius*math.sin(phi)), cq.Vector(0, 0, 1), phi_deg) * transform)
+    return locs
+
+
+@lru_cache(maxsize=None)
+def get_first_fit_table(nominal_values: tuple[float, ...]):
+    """running maximum of nominal values, searchsorted on it gives the first value that fits a target
+
+    Parameters
+    ==========
+
+    nominal_values: tuple[float, ...]
+        nominal values in catalog order
+
+    """
+    table = np.maximum.accumulate(np.asarray(nominal_values, dtype=np.float64))
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def get_nominal_diameters(nominal_size_range: tuple[str, ...]):
+    """nominal diameters parsed once from size names such as M3-0.5
+
+    Parameters
+    ==========
+
+    nominal_size_range: tuple[str, ...]
+        nominal sizes in catalog order
+
+    """
+    return tuple(float(NOMINAL_SIZE_PATTERN.match(nominal_size).group(1)) for nominal_size in nominal_size_range)  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def get_heatset_table(type: str):
+    """nut diameters and thicknesses of every heatset size in catalog order, only dimensions are cached since holes record placements on fastener instances (nominal sizes, diameters, thicknesses)
+
+    Parameters
+    ==========
+
+    type: str
+        heatset type
+
+    """
+    nominal_size_range = tuple(HeatSetNut.sizes(type))
+    heatsets = [HeatSetNut(size=nominal_size, fastener_type=type, simple=True) for nominal_size in nominal_size_range]
+    diameters = np.array([heatset.nut_diameter for heatset in heatsets], dtype=np.float64)
+    thicknesses = np.array([heatset.nut_thickness for heatset in heatsets], dtype=np.float64)
+    diameters.setflags(write=False)
+    thicknesses.setflags(write=False)
+    return nominal_size_range, diameters, thicknesses
+
+
+@njit(cache=True)
+def get_heatset_index(diameters: np.ndarray, thicknesses: np.ndarray, target_diameter: float, max_thickness: float):
+    "index of first heatset fitting target diameter, last thinner one if it is too thick, -1 if none fit and -2 if none are thin enough (dimensionless)"
+    last_acceptable_height_index = -1
+    for i in range(diameters.shape[0]):
+        if max_thickness and thicknesses[i] <= max_thickness:
+            last_acceptable_height_index = i
+        if target_diameter <= diameters[i]:
+            if max_thickness and thicknesses[i] > max_thickness:
+                return last_acceptable_height_index if last_acceptable_height_index >= 0 else -2
+            return i
+    return -1
+
+
 class FastenerPredicter:
     @staticmethod
     def get_nominal_size(
         target_diameter: float,
         nominal_size_range: List[str],
     ):
-        for nominal_size in nominal_size_range:
-            nominal_diameter = float(nominal_size.split("-")[0].replace("M", ""))
-            if target_diameter <= nominal_diameter:
-                return nominal_size
+        nominal_size_range = tuple(nominal_size_range)
+        table = get_first_fit_table(get_nominal_diameters(nominal_size_range))
+        index = int(np.searchsorted(table, target_diameter, side="left"))
+        if index < len(table):
+            return nominal_size_range[index]
 
         raise ValueError(f"nominal size for target diameter {target_diameter} could not be found")
 
@@ -75,30 +179,21 @@ class FastenerPredicter:
         target_length: float,
         nominal_length_range: List[float],
     ):
-        for nominal_length in nominal_length_range:
-            if target_length <= nominal_length:
-                return nominal_length
+        table = get_first_fit_table(tuple(nominal_length_range))
+        index = int(np.searchsorted(table, target_length, side="left"))
+        if index < len(table):
+            return nominal_length_range[index]
         raise ValueError(f"nominal length for target length {target_length} could not be found")
 
 
     @staticmethod
     def predict_heatset(target_diameter: float, max_thickness: Optional[float] = None, type: str = "Hilitchi"):
-        nominal_size_range = HeatSetNut.sizes(type)
-        last_acceptable_height_heatset: Optional[HeatSetNut] = None
-        for nominal_size in nominal_size_range:
-            heatset = HeatSetNut(
-                size=nominal_size,
-                fastener_type=type,
-                simple=True,
-            )
-            if max_thickness and heatset.nut_thickness <= max_thickness:
-                last_acceptable_height_heatset = heatset
-            if target_diameter <= heatset.nut_diameter :
-                if max_thickness and heatset.nut_thickness > max_thickness:
-                    assert last_acceptable_height_heatset is not None, f"no heasets are valid for max height {max_thickness}, closest heatset {heatset.nut_diameter}"
-                    return last_acceptable_height_heatset
-                return heatset
-        raise ValueError(f"nominal size for target diameter {target_diameter} could not be found")
+        nominal_size_range, diameters, thicknesses = get_heatset_table(type)
+        index = get_heatset_index(diameters, thicknesses, target_diameter, max_thickness or 0.0)
+        if index == -1:
+            raise ValueError(f"nominal size for target diameter {target_diameter} could not be found")
+        assert index != -2, f"no heasets are valid for max height {max_thickness}, closest heatset {next(diameter for diameter in diameters if target_diameter <= diameter)}"
+        return HeatSetNut(size=nominal_size_range[index], fastener_type=type, simple=True)
 
 
     @staticmethod
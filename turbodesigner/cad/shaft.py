@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Optional
 import cadquery as cq
-from turbodesigner.cad.common import ExtendedWorkplane, FastenerPredicter
+from turbodesigner.cad.common import INWARD_RADIAL_HOLE_LOCATION, OUTWARD_RADIAL_HOLE_LOCATION, ExtendedWorkplane, FastenerPredicter, get_polar_locations
 from turbodesigner.cad.blade import BladeCadModel, BladeCadModelSpecification
 from turbodesigner.stage import StageCadExport
 from turbodesigner.turbomachinery import TurbomachineryCadExport
@@ -120,6 +120,7 @@ class ShaftCadModel:
         )
 
         if not self.spec.is_simple:
+            # hole cuts only clean when no later cut cleans the shaft again
             shaft_profile = (
                 shaft_profile
 
@@ -152,15 +153,15 @@ class ShaftCadModel:
                 .faces(">Z")
                 .workplane(offset=-self.stage_connect_height-self.blade_cad_model.lock_screw.head_diameter*1.5)
                 .polarArray(self.stage_connect_inner_radius, 0, 360, self.stage.rotor.number_of_blades)
-                .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), -90))
-                .clearanceHole(self.blade_cad_model.lock_screw, fit="Loose", baseAssembly=fastener_assembly)
+                .mutatePoints(OUTWARD_RADIAL_HOLE_LOCATION)
+                .clearanceHole(self.blade_cad_model.lock_screw, fit="Loose", baseAssembly=fastener_assembly, clean=False)
 
                 # Shaft Connect Heatsets
                 .faces(">Z")
                 .workplane(offset=-self.stage_connect_height/2)
                 .polarArray(self.stage_connect_outer_radius, 0, 360, self.spec.stage_connect_screw_quantity)
-                .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 90))
-                .insertHole(self.stage_connect_heatset, fit="Loose", baseAssembly=fastener_assembly, depth=self.stage_connect_heatset.nut_thickness)
+                .mutatePoints(INWARD_RADIAL_HOLE_LOCATION)
+                .insertHole(self.stage_connect_heatset, fit="Loose", baseAssembly=fastener_assembly, depth=self.stage_connect_heatset.nut_thickness, clean=self.next_stage_shaft_cad_model is None)
             )
             if self.next_stage_shaft_cad_model:
                 shaft_profile = (
@@ -175,21 +176,20 @@ class ShaftCadModel:
                     .faces("<Z")
                     .workplane(offset=-self.next_stage_shaft_cad_model.stage_connect_height/2)
                     .polarArray(self.next_stage_shaft_cad_model.stage.rotor.hub_radius, 0, 360, self.spec.stage_connect_screw_quantity)
-                    .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 90))
+                    .mutatePoints(INWARD_RADIAL_HOLE_LOCATION)
                     .clearanceHole(self.next_stage_stage_connect_screw, fit="Loose", baseAssembly=fastener_assembly)
                 )
 
         blade_vertical_offset = self.stage.stage_gap+self.stage.stator.disk_height+self.stage.row_gap+self.stage.rotor.disk_height/2
-        blade_assembly_locs = (
-            ExtendedWorkplane("XY")
-            .polarArray(self.stage.rotor.hub_radius, 0, 360, self.stage.rotor.number_of_blades)
-            .mutatePoints(lambda loc: loc * cq.Location(cq.Vector(0, 0, blade_vertical_offset), cq.Vector(0, 1, 0), 90))
-            .vals()
+        blade_assembly_locs = get_polar_locations(
+            self.stage.rotor.hub_radius,
+            self.stage.rotor.number_of_blades,
+            cq.Location(cq.Vector(0, 0, blade_vertical_offset), cq.Vector(0, 1, 0), 90)
         )
 
+        stage_blade_assembly = self.blade_cad_model.blade_assembly
         for (i, blade_assembly_loc) in enumerate(blade_assembly_locs):
-            assert isinstance(blade_assembly_loc, cq.Location)
-            blade_assembly.add(self.blade_cad_model.blade_assembly, loc=blade_assembly_loc, name=f"Blade {i+1}")
+            blade_assembly.add(stage_blade_assembly, loc=blade_assembly_loc, name=f"Blade {i+1}")
 
         base_assembly.add(shaft_profile, name=f"Stage Shaft")
         base_assembly.add(blade_assembly, name="Blades")
@@ -1,7 +1,8 @@
-from functools import cached_property
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Union
+from numba import njit
 import numpy as np
+import math
 
 PROP_NON_STREAM_ERROR = "Property not allowed with streams"
 
@@ -20,7 +21,72 @@ class FluidConstants:
     "sutherland constant (K)"
 
 
-@dataclass
+# sutherland constants as plain globals so the jitted kernel can freeze them
+_MU_REF = FluidConstants.MU_REF
+_T0_REF = FluidConstants.T0_REF
+_C_SUTHERLAND = FluidConstants.C
+
+
+@njit(cache=True)
+def _derive_all(gamma, Rs, Tt, Pt, Vm, alpha, N, radius, is_alpha_undefined):
+    "derived flow properties in one pass (U, V, Vtheta, Wtheta, W, beta, T, P, rho, Ttr, Ptr, Vcr, h, ht, Cp, q, a, mu, MN, omega)"
+    # velocity triangle
+    omega = N*(np.pi/30)
+    U = omega*radius
+    Vtheta = Vm*np.tan(alpha)
+    Wtheta = Vtheta - U
+    beta = np.arctan2(Wtheta, Vm)
+
+    # magnitudes from components, equivalent to Vm/cos(alpha) and Vm/cos(beta)
+    # only an entirely undefined flow angle is treated as purely meridional flow for V
+    if is_alpha_undefined:
+        V = np.hypot(Vm, np.nan_to_num(Vtheta))
+    else:
+        V = np.hypot(Vm, Vtheta)
+    W = np.hypot(Vm, Wtheta)
+
+    # isentropic exponent shared by Cp and both pressure relations
+    k = gamma/(gamma - 1)
+    Cp = Rs*k
+    T = Tt - (V**2)/(2*Cp)
+    P = Pt*(T/Tt)**k
+    rho = P/(T*Rs)
+    Ttr = Tt + (W**2 - V**2)/(2*Cp)
+    Ptr = Pt*(Ttr/Tt)**k
+    Vcr = np.sqrt(((2*gamma)/(gamma+1)) * Rs*Tt)
+
+    # static and transport properties
+    h = T*Cp
+    ht = h + (V**2)/2
+    q = 0.5*rho*Vm**2
+    a = np.sqrt(T*Rs*gamma)
+    mu = _MU_REF * ((T / _T0_REF)**1.5) * ((_T0_REF + _C_SUTHERLAND) / (T + _C_SUTHERLAND))
+    MN = Vm/a
+    return U, V, Vtheta, Wtheta, W, beta, T, P, rho, Ttr, Ptr, Vcr, h, ht, Cp, q, a, mu, MN, omega
+
+
+def _as_float(value: Union[float, np.ndarray]):
+    "casts scalar or array input to float64 so kernels compile once per shape"
+    if isinstance(value, np.ndarray):
+        return value.astype(np.float64, copy=False)
+    return float(value)
+
+
+def _xp(value: Union[float, np.ndarray]):
+    "math module for scalars and numpy for arrays, avoiding ufunc overhead on scalars"
+    return np if isinstance(value, np.ndarray) else math
+
+
+_DERIVATION_INPUTS = frozenset(("gamma", "Rs", "Tt", "Pt", "Vm", "alpha", "N", "radius"))
+"inputs of FlowStation.derive, assigning any of them re-derives the station"
+
+
+def _derived():
+    "derived field set by FlowStation.derive, excluded from init, repr and comparison"
+    return field(init=False, repr=False, compare=False)
+
+
+@dataclass(slots=True)
 class FlowStation:
     "calculates flow station for an ideal gas"
 
@@ -60,6 +126,67 @@ class FlowStation:
     is_stream: bool = False
     "whether station is 1D stream"
 
+    # %% Derived Properties
+    U: Union[float, np.ndarray] = _derived()
+    "blade velocity (m/s)"
+
+    V: Union[float, np.ndarray] = _derived()
+    "absolute flow velocity (m/s)"
+
+    Vtheta: Union[float, np.ndarray] = _derived()
+    "absolute tangential velocity (m/s)"
+
+    Wtheta: Union[float, np.ndarray] = _derived()
+    "relative tangential flow velocity (m/s)"
+
+    W: Union[float, np.ndarray] = _derived()
+    "relative flow velocity (m/s)"
+
+    beta: Union[float, np.ndarray] = _derived()
+    "relative flow angle (rad)"
+
+    T: Union[float, np.ndarray] = _derived()
+    "static temperature (K)"
+
+    P: Union[float, np.ndarray] = _derived()
+    "static pressure (Pa)"
+
+    rho: Union[float, np.ndarray] = _derived()
+    "density (kg/m**3)"
+
+    Ttr: Union[float, np.ndarray] = _derived()
+    "total realtive temperature (K)"
+
+    Ptr: Union[float, np.ndarray] = _derived()
+    "total relative pressure (Pa)"
+
+    Vcr: Union[float, np.ndarray] = _derived()
+    "critical velocity (m/s)"
+
+    h: Union[float, np.ndarray] = _derived()
+    "static enthalpy (J/kg*K)"
+
+    ht: Union[float, np.ndarray] = _derived()
+    "total enthalpy (J/kg*K)"
+
+    Cp: Union[float, np.ndarray] = _derived()
+    "specific heat at constant pressure (J/(kg*K))"
+
+    q: Union[float, np.ndarray] = _derived()
+    "dynamic pressure (Pa)"
+
+    a: Union[float, np.ndarray] = _derived()
+    "speed of sound in medium (m/s)"
+
+    mu: Union[float, np.ndarray] = _derived()
+    "dynamic velocity using Sutherland's formula ((N*s)/m**2)"
+
+    MN: Union[float, np.ndarray] = _derived()
+    "mach number (dimensionless)"
+
+    omega: Union[float, np.ndarray] = _derived()
+    "blade angular velocity (rad/s)"
+
     def copyFlow(
         self,
         Tt: Optional[float] = None,
@@ -108,127 +235,69 @@ class FlowStation:
             mixture=self.mixture
         )
 
-    @cached_property
-    def h(self):
-        "static enthalpy (J/kg*K)"
-        return self.T*self.Cp
-
-    @cached_property
-    def ht(self):
-        "total enthalpy (J/kg*K)"
-        return self.h + (self.V**2)/2
-
-    @cached_property
-    def Cp(self):
-        "specific heat at constant pressure (J/(kg*K))"
-        return self.Rs*self.gamma/(self.gamma - 1)
-
-    @cached_property
-    def T(self):
-        "static temperature (K)"
-        return self.Tt - (self.V**2)/(2*self.Cp)
-
-    @cached_property
-    def Ttr(self):
-        "total realtive temperature (K)"
-        return self.Tt + (self.W**2 - self.V**2)/(2*self.Cp)
-
-    @cached_property
-    def P(self):
-        "static pressure (Pa)"
-        return self.Pt*(self.T/self.Tt)**(self.gamma/(self.gamma - 1))
-
-    @cached_property
-    def Ptr(self):
-        "total relative pressure (Pa)"
-        return self.Pt*(self.Ttr/self.Tt)**(self.gamma/(self.gamma - 1))
-
-    @cached_property
-    def rho(self):
-        "density (kg/m**3)"
-        return self.P/(self.T*self.Rs)
-
-    @cached_property
-    def q(self):
-        "dynamic pressure (Pa)"
-        return 0.5*self.rho*self.Vm**2
-
-    @cached_property
-    def a(self):
-        "speed of sound in medium (m/s)"
-        return np.sqrt(self.T*self.Rs*self.gamma)
-
-    @cached_property
-    def mu(self):
-        "dynamic velocity using Sutherland's formula ((N*s)/m**2)"
-        return FluidConstants.MU_REF * ((self.T / FluidConstants.T0_REF)**1.5) * ((FluidConstants.T0_REF + FluidConstants.C) / (self.T + FluidConstants.C))
-
-    @cached_property
-    def MN(self):
-        "mach number (dimensionless)"
-        return self.Vm/self.a
-
-    @cached_property
-    def Vcr(self):
-        "critical velocity (m/s)"
-        return np.sqrt(((2*self.gamma)/(self.gamma+1)) * self.Rs*self.Tt)
-
-    @cached_property
-    def U(self):
-        "blade velocity (m/s)"
-        return FlowStation.calc_U(self.N, self.radius)
-
-    @cached_property
-    def omega(self):
-        "blade angular velocity (rad/s)"
-        return self.U/self.radius
-
-    @cached_property
-    def Vtheta(self):
-        "absolute tangential velocity (m/s)"
-        return self.Vm*np.tan(self.alpha)
-
-    @cached_property
-    def V(self):
-        "absolute flow velocity (m/s)"
-        if np.isnan(self.alpha).all():
-            return self.Vm
-        return self.Vm/np.cos(self.alpha)
-
-    @cached_property
-    def Wtheta(self):
-        "relative tangential flow velocity (m/s)"
-        return self.Vtheta - self.U
-
-    @cached_property
-    def beta(self):
-        "relative flow angle (rad)"
-        return np.arctan(self.Wtheta/self.Vm)
-
-    @cached_property
-    def W(self):
-        "relative flow velocity (m/s)"
-        return self.Vm/np.cos(self.beta)
+    def __post_init__(self):
+        self.derive()
+
+    def __setattr__(self, name: str, value):
+        object.__setattr__(self, name, value)
+        # derived fields are unset until __post_init__, so init assignments derive only once
+        if name in _DERIVATION_INPUTS and hasattr(self, "omega"):
+            self.derive()
+
+    def derive(self):
+        "derives velocity triangle and stagnation properties from station inputs"
+        (
+            self.U,
+            self.V,
+            self.Vtheta,
+            self.Wtheta,
+            self.W,
+            self.beta,
+            self.T,
+            self.P,
+            self.rho,
+            self.Ttr,
+            self.Ptr,
+            self.Vcr,
+            self.h,
+            self.ht,
+            self.Cp,
+            self.q,
+            self.a,
+            self.mu,
+            self.MN,
+            self.omega,
+        ) = _derive_all(
+            _as_float(self.gamma),
+            _as_float(self.Rs),
+            _as_float(self.Tt),
+            _as_float(self.Pt),
+            _as_float(self.Vm),
+            _as_float(self.alpha),
+            _as_float(self.N),
+            _as_float(self.radius),
+            bool(np.isnan(self.alpha).all()),
+        )
 
     # %% Annular Properties
-    @cached_property
+    @property
     def A_flow(self):
         "cross-sectional flow area (m**2)"
         assert not self.is_stream, PROP_NON_STREAM_ERROR
         return self.mdot/(self.rho*self.Vm)
 
-    @cached_property
+    @property
     def A_phys(self):
         "physical cross sectional area (m**2)"
         return self.A_flow*(self.B + 1)
 
-    @cached_property
+    @property
     def outer_radius(self):
         "flow outer radius (m)"
         assert not self.is_stream, PROP_NON_STREAM_ERROR
-        return self.A_phys/(4*np.pi*self.radius) + self.radius
+        return self.A_phys/(4*math.pi*self.radius) + self.radius
 
-    @cached_property
+    @property
     def inner_radius(self):
         "flow inner radius (m)"
         assert not self.is_stream, PROP_NON_STREAM_ERROR
@@ -249,7 +318,8 @@ class FlowStation:
 
         """
 
-        outer_radius = np.sqrt(A_phys / (np.pi*(1-ht**2)))
+        outer_radius_squared = A_phys / (math.pi*(1-ht**2))
+        outer_radius = _xp(outer_radius_squared).sqrt(outer_radius_squared)
         inner_radius = ht * outer_radius
         return (outer_radius + inner_radius) / 2
 
@@ -268,7 +338,7 @@ class FlowStation:
 
         """
 
-        return 2*np.pi*N*radius/60
+        return 2*math.pi*N*radius/60
 
     def set_radius(self, ht: float):
         """sets radius from hub to tip ratio
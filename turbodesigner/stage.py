@@ -8,13 +8,32 @@ from turbodesigner.flow_station import FlowStation
 from turbodesigner.units import MM
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StageBladeProperty:
     rotor: float
     stator: float
 
+    @classmethod
+    def uniform(cls, rotor: float, stator: float, N_stg: int) -> list["StageBladeProperty"]:
+        """same blade property shared by every stage (list[StageBladeProperty])
 
-@dataclass
+        Parameters
+        ==========
+
+        rotor: float
+            rotor blade property
+
+        stator: float
+            stator blade property
+
+        N_stg: int
+            number of stages (dimensionless)
+
+        """
+        return [cls(rotor, stator)]*N_stg
+
+
+@dataclass(slots=True, frozen=True)
 class StageCadExport:
     rotor: BladeRowCadExport
     "rotor blade row"
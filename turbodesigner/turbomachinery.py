@@ -1,6 +1,8 @@
-from functools import cached_property
+import copy
+from functools import cached_property, lru_cache
 from dataclasses import dataclass
 import json
+import os
 from typing import Literal, Union
 import numpy as np
 from turbodesigner.blade.row import MetalAngleMethods
@@ -10,7 +12,41 @@ from dacite.core import from_dict
 Number = Union[int, float]
 
 
-@dataclass
+def stack_stage_values(value: Union[Number, list[Number]], N_stg: int) -> np.ndarray:
+    """broadcasts single or per stage value to array of stage values (np.ndarray)
+
+    Parameters
+    ==========
+
+    value: Number | list[Number]
+        value for all stages or for each stage
+
+    N_stg: int
+        number of stages (dimensionless)
+
+    """
+    return np.broadcast_to(np.asarray(value, dtype=np.float64), (N_stg,))
+
+
+@lru_cache(maxsize=32)
+def load_design_file(file_name: str, mtime: float) -> dict:
+    """loads design JSON, cached per file and modification time
+
+    Parameters
+    ==========
+
+    file_name: str
+        absolute path of design file
+
+    mtime: float
+        modification time of design file, invalidates cache on change
+
+    """
+    with open(file_name, "r") as fp:
+        return json.load(fp)
+
+
+@dataclass(slots=True, frozen=True)
 class TurbomachineryCadExport:
     stages: list[StageCadExport]
     "turbomachinery stages"
@@ -161,22 +197,27 @@ class Turbomachinery:
         if isinstance(self.tbc, list):
             assert len(self.tbc) == self.N_stg, "tbc quantity does not equal N_stg"
 
+        Delta_Tt_stg = stack_stage_values(self.Delta_T0/self.N_stg if self.Delta_T0_stg == "equal" else self.Delta_T0_stg, self.N_stg)
+        R_stg = stack_stage_values(self.R_stg, self.N_stg)
+        rgc_stg = stack_stage_values(self.rgc, self.N_stg)
+        sgc_stg = stack_stage_values(self.sgc, self.N_stg)
+
         previous_flow_station = self.inlet_flow_station
         stages: list[Stage] = []
-        # TODO: make this more efficient with Numba
+        # stages are built in order since each stage starts from the previous stage mid flow station
         for i in range(self.N_stg):
             stage = Stage(
                 stage_number=i+1,
-                Delta_Tt=self.Delta_T0_stg[i] if isinstance(self.Delta_T0_stg, list) else self.Delta_T0/self.N_stg,
-                R=self.R_stg[i] if isinstance(self.R_stg, list) else self.R_stg,
+                Delta_Tt=Delta_Tt_stg[i],
+                R=R_stg[i],
                 previous_flow_station=previous_flow_station,
                 eta_poly=self.eta_poly,
                 N_stream=self.N_stream,
                 AR=self.AR[i] if isinstance(self.AR, list) else self.AR,
                 sc=self.sc[i] if isinstance(self.sc, list) else self.sc,
                 tbc=self.tbc[i] if isinstance(self.tbc, list) else self.tbc,
-                rgc=self.rgc[i] if isinstance(self.rgc, list) else self.rgc,
-                sgc=self.sgc[i] if isinstance(self.sgc, list) else self.sgc,
+                rgc=rgc_stg[i],
+                sgc=sgc_stg[i],
                 metal_angle_method=self.metal_angle_method
             )
             previous_flow_station = stage.mid_flow_station
@@ -199,6 +240,6 @@ class Turbomachinery:
 
     @staticmethod
     def from_file(file_name: str) -> "Turbomachinery":
-        with open(file_name, "r") as fp:
-            obj = json.load(fp)
-        return from_dict(data_class=Turbomachinery, data=obj)
+        file_path = os.path.abspath(file_name)
+        obj = load_design_file(file_path, os.path.getmtime(file_path))
+        return from_dict(data_class=Turbomachinery, data=copy.deepcopy(obj))